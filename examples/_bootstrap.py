@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+
+# shared header for the examples, import it before any other xauto module
+# inside the venv the repo root is already on sys.path via xauto.pth
+
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from xauto.bootstrap.build import bootstrap
+if not bootstrap():
+    print("Bootstrap failed")
+    sys.exit(1)
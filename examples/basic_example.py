@@ -1,13 +1,6 @@
 #!/usr/bin/env python3
 
-import os 
-import sys 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from xauto.bootstrap.build import bootstrap
-if not bootstrap():
-    print("Bootstrap failed")
-    sys.exit(1)
+import _bootstrap
 
 from xauto.utils.config import Config
 from xauto.utils.setup import get_options
@@ -16,6 +9,8 @@ from xauto.runtime.lifecycle import get_worker_limits
 from xauto.runtime.task_manager import TaskManager
 from xauto.internal.geckodriver.driver import get_driver_pool
 
+from concurrent.futures import ThreadPoolExecutor
+
 config = Config()
 config.freeze()
 
@@ -26,16 +21,32 @@ def task(task_data, driver):
     debug_logger.info(f"Visited {url}, title: {title}")
     return title
 
+def start_driver_pool(max_drivers, options, warm_drivers):
+    driver_pool = get_driver_pool(
+        max_size=max_drivers,
+        firefox_options=options
+    )
+    driver_pool.warm_up(warm_drivers)
+    return driver_pool
+
 def main():
     options = get_options()
 
     # limts go off system.driver_limit
     max_drivers, max_workers = get_worker_limits()
 
-    driver_pool = get_driver_pool(
-        max_size=max_drivers,
-        firefox_options=options
-    )
+    # boot the first drivers in the background while the task list is built
+    executor = ThreadPoolExecutor(max_workers=1)
+    pool_future = executor.submit(start_driver_pool, max_drivers, options, max_workers)
+
+    tasks = [
+        {"url": "https://example.com"},
+        {"url": "https://www.python.org"},
+        {"url": "https://github.com"},
+    ]
+
+    driver_pool = pool_future.result()
+    executor.shutdown()
 
     task_manager = TaskManager(
         driver_pool=driver_pool,
@@ -45,11 +56,7 @@ def main():
 
     task_manager.start()
 
-    task_manager.add_tasks([
-        {"url": "https://example.com"},
-        {"url": "https://www.python.org"},
-        {"url": "https://github.com"},
-    ])
+    task_manager.add_tasks_batch(tasks)
 
     task_manager.wait_completion()
 
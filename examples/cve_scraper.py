@@ -1,21 +1,26 @@
 #!/usr/bin/env python3
 
-import os 
-import sys
+import _bootstrap
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from xauto.bootstrap.build import bootstrap
-if not bootstrap():
-    print("Bootstrap failed")
-    sys.exit(1)
-    
 from xauto.utils.config import Config
 from xauto.runtime.lifecycle import setup_runtime, teardown_runtime, runtime_state
 from xauto.utils.page_loading import wait_for_page_load
-from xauto.utils.validation import is_bot_page
+from xauto.utils.validation import is_bot_page, CF_TITLE, CF_CHALLENGE_INDICATORS
+from xauto.utils.setup import get_random_user_agent
 from xauto.utils.utility import counter
-from xauto.utils.common import status_print 
+from xauto.utils.common import status_print
+
+import asyncio
+import aiohttp
+import lxml.etree
+import lxml.html
+from urllib.parse import urlparse
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 config = Config()
 config.set("proxy.enabled", False)
@@ -24,11 +29,78 @@ config.freeze()
 
 BASE_URL = "https://www.cvedetails.com/cve/"
 TARGETS_CVE = [
-    {'cve_id': 'CVE-2025-54769'}, 
+    {'cve_id': 'CVE-2025-54769'},
     {'cve_id': 'CVE-2025-54768'},
-    {'cve_id': 'CVE-2025-476'}
+    {'cve_id': 'CVE-2025-476'},
+    # pages behind bot protection or rendered with JS go through a driver
+    # {'cve_id': 'CVE-2025-0001', 'requires_js': True},
 ]
 
+# politeness limits for the aiohttp path
+MAX_CONCURRENT_REQUESTS = 16
+MAX_REQUESTS_PER_HOST = 4
+
+def _is_challenge(root, html):
+    title = (root.findtext('.//title') or "").lower()
+    if CF_TITLE.search(title):
+        return True
+    page = html.lower()
+    return any(indicator in page for indicator in CF_CHALLENGE_INDICATORS)
+
+def _host_semaphore(host_sems, url):
+    host = urlparse(url).netloc
+    sem = host_sems.get(host)
+    if sem is None:
+        sem = host_sems[host] = asyncio.Semaphore(MAX_REQUESTS_PER_HOST)
+    return sem
+
+async def scrape_async(session, cve_id, sem, host_sems):
+    # returns False when the page needs a driver instead
+    url = f"{BASE_URL}{cve_id}/"
+    try:
+        async with sem, _host_semaphore(host_sems, url):
+            print(f"[xauto] Fetching {url}")
+            async with session.get(url, headers={"User-Agent": get_random_user_agent()}) as resp:
+                if resp.status >= 400:
+                    print(f"Page returned {resp.status}")
+                    counter("failed")
+                    counter("completed")
+                    return True
+                html = await resp.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"Page did not load {e}")
+        counter("failed")
+        counter("completed")
+        return True
+
+    try:
+        root = lxml.html.fromstring(html)
+    except lxml.etree.ParserError as e:
+        # empty or unparsable body, count it instead of aborting the gather
+        print(f"Page did not parse {e}")
+        counter("failed")
+        counter("completed")
+        return True
+
+    if _is_challenge(root, html):
+        print(f"Challenge page on {url}, retrying with a driver")
+        return False
+
+    print(html[:100])
+    counter("successful")
+    counter("completed")
+    return True
+
+async def scrape_all_async(targets):
+    timeout = aiohttp.ClientTimeout(total=Config.get("misc.timeouts.max_url_load_wait") * 2)
+    connector = aiohttp.TCPConnector(limit=256, limit_per_host=MAX_REQUESTS_PER_HOST)
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    host_sems = {}
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(*[
+            scrape_async(session, t['cve_id'], sem, host_sems) for _, t in targets
+        ])
+
 def scrape(current_task, driver, tasks):
     try:
         task = tasks[current_task]
@@ -54,12 +126,21 @@ def scrape(current_task, driver, tasks):
     finally:
         counter("completed")
 
+# workers only acquire a driver once a task is queued
+# so static pages never pay the geckodriver startup cost
 task_manager, driver_pool = setup_runtime(task_processor=scrape)
-task_manager.add_tasks(TARGETS_CVE)
 
 # add to the runtime_state created in setup_runtime()
 runtime_state['tasks'].extend(TARGETS_CVE)
 
+static_targets = [(i, t) for i, t in enumerate(TARGETS_CVE) if not t.get('requires_js')]
+results = asyncio.run(scrape_all_async(static_targets))
+
+js_indices = [i for i, t in enumerate(TARGETS_CVE) if t.get('requires_js')]
+js_indices += [idx for (idx, _), done in zip(static_targets, results) if not done]
+if js_indices:
+    task_manager.add_tasks_batch(TARGETS_CVE, indices=js_indices)
+
 task_manager.wait_completion()
 
 teardown_runtime(task_manager, driver_pool)
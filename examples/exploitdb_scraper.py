@@ -1,13 +1,6 @@
 #!/usr/bin/env python3
 
-import os 
-import sys 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from xauto.bootstrap.build import bootstrap
-if not bootstrap():
-    print("Bootstrap failed")
-    sys.exit(1)
+import _bootstrap
 
 from xauto.utils.config import Config
 from xauto.utils.page_loading import wait_for_page_load
@@ -155,7 +148,7 @@ def get_data(task_idx, driver, tasks):
 
 task_manager, driver_pool = setup_runtime(task_processor=get_data)
 
-task_manager.add_tasks(TARGETS)
+task_manager.add_tasks_batch(TARGETS)
 
 task_manager.wait_completion()
 teardown_runtime(task_manager, driver_pool)
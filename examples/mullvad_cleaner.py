@@ -1,13 +1,9 @@
 #!/usr/bin/env python3
 
+import _bootstrap
 import os
 import sys
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from xauto.bootstrap.build import bootstrap
-if not bootstrap():
-    print("Bootstrap failed")
-    sys.exit(1)
+import atexit
 
 from xauto.utils.setup import get_options
 from xauto.utils.page_loading import wait_for_page_load
@@ -16,7 +12,11 @@ from xauto.internal.geckodriver.driver import get_driver_pool
 from xauto.utils.browser_utils import send_key
 
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
+import requests
 
 TOKEN = os.environ.get("MULLVAD_ACCOUNT")
 if not TOKEN:
@@ -27,6 +27,26 @@ KEEP_NAMES = {
     "neat coral",
 }
 
+COLLECT_DEVICES_JS = """
+return Array.from(document.querySelectorAll('.device-header')).map(h => {
+    const title = h.querySelector('h2');
+    const form = h.parentElement ? h.parentElement.querySelector('form') : null;
+    const fields = {};
+    let action = null;
+    if (form) {
+        for (const [k, v] of new FormData(form)) fields[k] = v;
+        const btn = form.querySelector("button[type='submit']");
+        if (btn && btn.name) fields[btn.name] = btn.value;
+        action = (btn && btn.formAction) || form.action;
+    }
+    return {
+        name: title ? title.textContent.trim().toLowerCase() : '',
+        action: action,
+        fields: fields,
+    };
+});
+"""
+
 from xauto.utils.config import Config
 config = Config()
 config.set("proxy.enabled", False)
@@ -46,12 +66,15 @@ def login_to_mullvad(driver):
     try:
         input = driver.find_element(By.NAME, "account_number")
         send_key(driver, input, TOKEN)
-        sleep(0.3)
 
-        btn = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+        btn = WebDriverWait(driver, 5).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']"))
+        )
+        before = driver.current_url
         btn.click()
 
-        sleep(2)  
+        # login url also contains /account so wait for the redirect instead
+        WebDriverWait(driver, 10).until(EC.url_changes(before))
         print("[xauto] Logged into Mullvad account.")
     except Exception as e:
         print(f"[xauto] Error in login_to_mullvad function: {e}")
@@ -68,28 +91,53 @@ def revoke_devices(driver):
         print("[xauto] Browser error page detected. Exiting.")
         return
 
-    devices = driver.find_elements(By.CLASS_NAME, "device-header")
+    # one JS round trip collects every revoke form instead of K element lookups
+    devices = driver.execute_script(COLLECT_DEVICES_JS) or []
     print(f"[xauto] Found {len(devices)} devices.")
 
-    for header in devices:
-        try:
-            name = header.find_element(By.TAG_NAME, "h2").text.strip().lower()
-            if name in KEEP_NAMES:
-                print(f"[xauto] Keeping device: {name}")
-                continue
-
-            xpath = header.find_element(By.XPATH, "..")
-            form = xpath.find_element(By.TAG_NAME, "form")
-            submit = form.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            print(f"[xauto] Revoking device: {name}")
-            submit.click()
-            sleep(1.5)
-        except Exception as e:
-            print(f"[xauto] Error in revoke_devices function: {e}")
+    to_revoke = []
+    for device in devices:
+        name = device.get("name", "")
+        if name in KEEP_NAMES:
+            print(f"[xauto] Keeping device: {name}")
+            continue
+        if not device.get("action"):
+            print(f"[xauto] No revoke form found for device: {name}")
+            continue
+        to_revoke.append(device)
+
+    if not to_revoke:
+        return
+
+    # cookies come from this login, closed on exit so each loop cycle doesn't leak a pool
+    with requests.Session() as session:
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+        session.headers.update({
+            "User-Agent": driver.execute_script("return navigator.userAgent"),
+            "Origin": "https://mullvad.net",
+            "Referer": driver.current_url,
+        })
+
+        def _revoke(device):
+            try:
+                resp = session.post(device["action"], data=device["fields"], timeout=10)
+                return device["name"], resp.status_code < 400, resp.status_code
+            except requests.RequestException as e:
+                return device["name"], False, e
+
+        with ThreadPoolExecutor(max_workers=min(8, len(to_revoke))) as executor:
+            for name, ok, status in executor.map(_revoke, to_revoke):
+                if ok:
+                    print(f"[xauto] Revoked device: {name}")
+                else:
+                    print(f"[xauto] Error revoking device {name}: {status}")
+
+# the pool outlives each run so the browser stays warm between cycles
+driver_pool = get_driver_pool(max_size=1, firefox_options=get_options())
+atexit.register(driver_pool.shutdown)
 
 def run():
-    options = get_options()
-    driver_pool = get_driver_pool(max_size=1, firefox_options=options)
     driver = None
 
     try:
@@ -107,9 +155,13 @@ def run():
     finally:
         if driver is not None:
             driver_pool.return_driver(driver)
-        driver_pool.shutdown()
 
 
+# pass --once to run a single clean and let cron or a systemd timer schedule it
+if "--once" in sys.argv:
+    run()
+    sys.exit(0)
+
 print("[xauto] Starting Mullvad auto clean loop.")
 while True:
     run()
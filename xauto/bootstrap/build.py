@@ -2,15 +2,22 @@
 
 import os
 import sys
+import glob
 import subprocess
+import atexit
 import logging
 import platform
+from logging.handlers import MemoryHandler
+import http.client
+from urllib.parse import urlsplit
 
 BOOTSTRAP_DIR = os.path.dirname(__file__)
 GET_PIP_PATH = os.path.join(BOOTSTRAP_DIR, "get-pip.py")
 LIB_DIR = os.path.normpath(os.path.join(BOOTSTRAP_DIR, ".."))
 INSTALLS_FILE = os.path.join(BOOTSTRAP_DIR, "installs.txt")
 VENV_DIR = os.path.join(BOOTSTRAP_DIR, "venv")
+PIP_CACHE_DIR = os.path.join(BOOTSTRAP_DIR, ".pip_cache")
+PATH_FILE_NAME = "xauto.pth"
 
 IS_WINDOWS = platform.system() == "Windows"
 if IS_WINDOWS:
@@ -25,17 +32,37 @@ BOOTSTRAP_DONE_MARKER = os.path.join(BOOTSTRAP_DIR, ".bootstrap_done")
 
 GET_PIP_URL = "https://bootstrap.pypa.io/get-pip.py"
 
+# bootstrap subprocesses run with close_fds=False, python creates fds non-inheritable
+# so nothing leaks and children skip the close-every-fd pass on fork
+
+_BOOTSTRAP_OK = False
+_LOG = None
+_LOG_BUFFER = None
+
 def setup_bootstrap_logger():
+    global _LOG, _LOG_BUFFER
+    if _LOG is not None:
+        return _LOG
+
     logger = logging.getLogger('bootstrap')
     if not logger.handlers:
         logger.setLevel(logging.INFO)
-        handler = logging.FileHandler(BOOTSTRAP_LOG)
+        handler = logging.FileHandler(BOOTSTRAP_LOG, delay=True)
         formatter = logging.Formatter('%(levelname)s - %(message)s')
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        # records are buffered and written together, errors flush immediately
+        _LOG_BUFFER = MemoryHandler(capacity=100, flushLevel=logging.ERROR, target=handler)
+        logger.addHandler(_LOG_BUFFER)
+        atexit.register(flush_bootstrap_logger)
+    _LOG = logger
     return logger
 
 
+def flush_bootstrap_logger():
+    if _LOG_BUFFER is not None:
+        _LOG_BUFFER.flush()
+
+
 def get_pip():
     logger = setup_bootstrap_logger()
     
@@ -46,17 +73,23 @@ def get_pip():
     logger.info(f"Downloading get-pip.py from {GET_PIP_URL}")
     print(f"Downloading get-pip.py from {GET_PIP_URL}")
     
+    parsed = urlsplit(GET_PIP_URL)
+    conn = http.client.HTTPSConnection(parsed.netloc, timeout=30)
     try:
-        subprocess.run(
-            ["curl", "-sSL", GET_PIP_URL, "-o", GET_PIP_PATH],
-            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-        )
-        if os.path.exists(GET_PIP_PATH):
-            logger.info("Downloaded get-pip.py using curl")
+        conn.request("GET", parsed.path)
+        resp = conn.getresponse()
+        data = resp.read()
+        if resp.status == 200 and data:
+            with open(GET_PIP_PATH, "wb") as f:
+                f.write(data)
+            logger.info("Downloaded get-pip.py using http.client")
             return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        logger.info("curl not available, trying urllib")
-    
+        logger.info(f"http.client got status {resp.status}, trying urllib")
+    except (OSError, http.client.HTTPException) as e:
+        logger.info(f"http.client download failed ({e}), trying urllib")
+    finally:
+        conn.close()
+
     try:
         import urllib.request
         urllib.request.urlretrieve(GET_PIP_URL, GET_PIP_PATH)
@@ -84,14 +117,36 @@ def is_venv_functional():
     
     if not os.path.exists(PYTHON_VENV_EXE):
         return False
-    
-    try:
-        # this hardcodes a package name, this might effect users if not inside installs.txt
-        result = subprocess.run([PYTHON_VENV_EXE, "-c", "import requests"], 
-                              capture_output=True, text=True, timeout=10)
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-        return False
+
+    # marker is only written once install_packages() has succeeded
+    if os.path.exists(BOOTSTRAP_DONE_MARKER):
+        return True
+
+    # probe the filesystem instead of spawning the venv interpreter
+    # this hardcodes a package name, this might effect users if not inside installs.txt
+    return any(os.path.isdir(os.path.join(sp, "requests")) for sp in get_venv_site_packages())
+
+
+def get_venv_site_packages():
+    if IS_WINDOWS:
+        return [os.path.join(VENV_DIR, "Lib", "site-packages")]
+    return glob.glob(os.path.join(VENV_DIR, "lib", "python*", "site-packages"))
+
+
+def install_path_file():
+    # a .pth entry puts the repo root on sys.path for every venv interpreter
+    logger = setup_bootstrap_logger()
+    root = os.path.dirname(LIB_DIR)
+    for sp in get_venv_site_packages():
+        pth = os.path.join(sp, PATH_FILE_NAME)
+        if os.path.exists(pth):
+            continue
+        try:
+            with open(pth, "w") as f:
+                f.write(f"{root}\n")
+            logger.info(f"Installed {pth}")
+        except OSError as e:
+            logger.error(f"Failed to write {pth}: {e}")
 
 
 def create_venv():
@@ -108,7 +163,7 @@ def create_venv():
         return False
 
     try:
-        subprocess.run([python, "-c", "import venv"], check=True, capture_output=True, text=True)
+        subprocess.run([python, "-c", "import venv"], check=True, capture_output=True, text=True, close_fds=False)
     except subprocess.CalledProcessError as e:
         logger.error("Missing bootstrap package python3-venv: install it with 'sudo apt install python3-venv'")
         print("Missing bootstrap package python3-venv: install it with 'sudo apt install python3-venv'")
@@ -117,7 +172,7 @@ def create_venv():
     logger.info(f"Creating virtual environment at {VENV_DIR}")
     try:
         subprocess.run([python, "-m", "venv", VENV_DIR], 
-                       check=True, capture_output=True, text=True)
+                       check=True, capture_output=True, text=True, close_fds=False)
 
         logger.info("Virtual environment created successfully")
         return True
@@ -142,7 +197,7 @@ def install_pip():
     logger.info("Installing pip using bundled get-pip.py")
     try:
         subprocess.run([PYTHON_VENV_EXE, GET_PIP_PATH, "--quiet", "--no-warn-script-location"], 
-                      check=True, capture_output=True, text=True)
+                      check=True, capture_output=True, text=True, close_fds=False)
         logger.info("pip installed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -152,6 +207,32 @@ def install_pip():
         return False
 
 
+def read_requirements():
+    with open(INSTALLS_FILE) as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+
+
+def download_packages():
+    logger = setup_bootstrap_logger()
+    if not read_requirements():
+        return False
+
+    os.makedirs(PIP_CACHE_DIR, exist_ok=True)
+
+    # a single pip download resolves all requirements together, so shared
+    # dependencies land once at versions that install together
+    logger.info(f"Downloading requirements to {PIP_CACHE_DIR}")
+    try:
+        subprocess.run([PIP_VENV_EXE, "download", "--disable-pip-version-check", "-d", PIP_CACHE_DIR, "-r", INSTALLS_FILE], 
+                       check=True, capture_output=True, text=True, close_fds=False)
+        return True
+    except subprocess.CalledProcessError as e:
+        logger.warning(f"Download incomplete, falling back to online install: {e}")
+        if e.stderr:
+            logger.warning(f"stderr: {e.stderr}")
+        return False
+
+
 def install_packages():
     logger = setup_bootstrap_logger()
     if not os.path.exists(INSTALLS_FILE):
@@ -163,11 +244,26 @@ def install_packages():
         return False
     
     logger.info("Installing required packages...")
+    # bytecode is compiled afterwards in parallel by compile_packages()
+    online_cmd = [PIP_VENV_EXE, "install", "--disable-pip-version-check", "--no-cache-dir", 
+                  "--no-compile", "-r", INSTALLS_FILE]
     try:
-        subprocess.run([PIP_VENV_EXE, "install", "--disable-pip-version-check", "--no-cache-dir", "-r", INSTALLS_FILE], 
-                                check=True, capture_output=True, text=True)
+        if download_packages():
+            offline_cmd = [PIP_VENV_EXE, "install", "--disable-pip-version-check", "--no-index", 
+                           "--no-compile", "--find-links", PIP_CACHE_DIR, "-r", INSTALLS_FILE]
+            try:
+                subprocess.run(offline_cmd, check=True, capture_output=True, text=True, close_fds=False)
+            except subprocess.CalledProcessError as e:
+                # e.g. an sdist needing build deps from an index, retry online
+                logger.warning(f"Offline install failed, retrying online: {e}")
+                if e.stderr:
+                    logger.warning(f"stderr: {e.stderr}")
+                subprocess.run(online_cmd, check=True, capture_output=True, text=True, close_fds=False)
+        else:
+            subprocess.run(online_cmd, check=True, capture_output=True, text=True, close_fds=False)
         logger.info("Package installation completed")
         print("Package installation completed")
+        compile_packages()
         return True
         
     except subprocess.CalledProcessError as e:
@@ -177,6 +273,21 @@ def install_packages():
         return False
 
 
+def compile_packages():
+    logger = setup_bootstrap_logger()
+    site_packages = get_venv_site_packages()
+    if not site_packages:
+        return
+
+    try:
+        subprocess.run([PYTHON_VENV_EXE, "-m", "compileall", "-j", str(os.cpu_count() or 1), "-q"] + site_packages, 
+                       check=True, capture_output=True, text=True, close_fds=False)
+        logger.info("Compiled site-packages bytecode")
+    except subprocess.CalledProcessError as e:
+        # not fatal, modules compile lazily on first import
+        logger.warning(f"Failed to compile site-packages: {e}")
+
+
 def bootstrap_venv():
     if is_in_venv():
         if is_venv_functional():
@@ -188,6 +299,8 @@ def bootstrap_venv():
     
     if os.path.exists(BOOTSTRAP_DONE_MARKER) and is_venv_functional():
         print("Bootstrap marker exists and venv is functional, switching to it...")
+        install_path_file()
+        flush_bootstrap_logger()
         try:
             os.execv(PYTHON_VENV_EXE, [PYTHON_VENV_EXE] + sys.argv)
         except OSError as e:
@@ -207,10 +320,13 @@ def bootstrap_venv():
     if not install_packages():
         print("Failed to install packages")
         sys.exit(1)
+
+    install_path_file()
     
     with open(BOOTSTRAP_DONE_MARKER, "w") as f:
         f.write("ok\n")
     
+    flush_bootstrap_logger()
     try:
         os.execv(PYTHON_VENV_EXE, [PYTHON_VENV_EXE] + sys.argv)
     except OSError as e:
@@ -218,6 +334,27 @@ def bootstrap_venv():
         sys.exit(1)
 
 
+def _fast_rmtree(path, dir_fd=None):
+    if not (os.unlink in os.supports_dir_fd and os.scandir in os.supports_fd):
+        import shutil
+        shutil.rmtree(path)
+        return
+
+    # scandir on a directory fd gives d_type without an extra stat and
+    # unlink relative to that fd avoids re-resolving the full path
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY, dir_fd=dir_fd)
+    try:
+        with os.scandir(fd) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    _fast_rmtree(entry.name, dir_fd=fd)
+                else:
+                    os.unlink(entry.name, dir_fd=fd)
+    finally:
+        os.close(fd)
+    os.rmdir(path, dir_fd=dir_fd)
+
+
 def cleanup_bootstrap():
     print("Cleaning up bootstrap state")
     
@@ -227,10 +364,13 @@ def cleanup_bootstrap():
             print("Removed bootstrap marker")
 
         if os.path.exists(VENV_DIR):
-            import shutil
-            shutil.rmtree(VENV_DIR)
+            _fast_rmtree(VENV_DIR)
             print("Removed virtual environment")
 
+        if os.path.exists(PIP_CACHE_DIR):
+            _fast_rmtree(PIP_CACHE_DIR)
+            print("Removed pip download cache")
+
         if os.path.exists(BOOTSTRAP_LOG):
             os.remove(BOOTSTRAP_LOG)
             print("Removed bootstrap log")
@@ -244,11 +384,16 @@ def cleanup_bootstrap():
 
 
 def bootstrap():
+    global _BOOTSTRAP_OK
+    if _BOOTSTRAP_OK:
+        return True
+
     if is_in_venv() and is_venv_functional():
         from xauto.utils.config import Config
         from xauto.utils.setup import check_python_version, download_geckodriver
         check_python_version(Config.get("misc.python_version", "3.10"))
         download_geckodriver(Config.get("misc.geckodriver_version", "0.35.0"))
+        _BOOTSTRAP_OK = True
         return True
 
     if is_in_venv() and not is_venv_functional():
@@ -1,6 +1,6 @@
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 from selenium.webdriver.remote.webelement import WebElement
 
 class ResourceStats:
@@ -11,20 +11,19 @@ class ResourceStats:
         self.cpu = cpu
 
 
+@dataclass(slots=True, eq=False)
 class TaskWrapper:
-    __slots__ = ('idx', 'retry_count', 'tasks')
-    
-    def __init__(self, idx: int, tasks: Optional[list] = None):
-        self.idx = idx
-        self.retry_count = 0
-        self.tasks = tasks 
+    idx: int
+    tasks: Optional[list] = None
+    retry_count: int = 0
 
 
 class DriverInfo:
-    __slots__ = ('pids', 'last_access', 'heap_timestamp', 'failure_count')
+    __slots__ = ('driver', 'procs', 'last_access', 'heap_timestamp', 'failure_count')
     
-    def __init__(self, pids: list[int]):
-        self.pids = pids
+    def __init__(self, driver: Any, procs: list[Any]):
+        self.driver = driver
+        self.procs = procs
         self.last_access = time.monotonic()
         self.heap_timestamp = self.last_access
         self.failure_count = 0
@@ -7,10 +7,17 @@ from xauto.internal.dataclasses import DriverInfo
 
 import os
 import time
-import queue
+import signal
+import subprocess
+import random
+import copy
+import logging
 import threading
-import psutil
+import itertools
+import heapq
 from termcolor import cprint
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 from selenium.webdriver.firefox.service import Service
 from selenium import webdriver
 from typing import Any, Optional
@@ -18,6 +25,33 @@ from typing import Any, Optional
 _driver_pool: Optional["DriverPool"] = None
 _driver_pool_lock = threading.Lock()
 
+def _stop_process(proc, grace=1.0) -> str:
+    # selenium's Popen owns the child, reap through it so its returncode stays
+    # valid and a recycled pid is never signalled
+    if proc.poll() is not None:
+        return "gone"
+    proc.terminate()
+    try:
+        proc.wait(timeout=grace)
+        return "terminated"
+    except subprocess.TimeoutExpired:
+        pass
+
+    if proc.poll() is None:
+        try:
+            os.kill(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    proc.wait()
+    return "killed"
+
+class _PoolWaiter:
+    __slots__ = ('event', 'driver')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.driver = None
+
 def get_driver_pool(
         max_size: Optional[Any] = None, 
         firefox_options: Optional[Any] = None, 
@@ -37,58 +71,75 @@ def get_driver_pool(
 
 
 class DriverRateLimiter:
+    # token bucket, max_per_window tokens refilled evenly over window_size_sec
+    # so a drained budget frees the next spawn after one interval, not a whole window
     def __init__(self, max_per_window: int = 10, window_size_sec: int = 60):
         self.max_per_window = max_per_window
         self.window_size_sec = window_size_sec
-        self.spawn_count = 0
-        self.window_start = time.monotonic()
+        self._refill_rate = max_per_window / window_size_sec
+        self._tokens = float(max_per_window)
+        self._last_refill = time.monotonic()
         self._lock = threading.Lock()
 
-    def try_acquire_slot(self, driver_pool=None) -> bool:
-        with self._lock:
-            now = time.monotonic()
-            if now - self.window_start > self.window_size_sec:
-                self.spawn_count = 0
-                self.window_start = now
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.max_per_window, self._tokens + (now - self._last_refill) * self._refill_rate)
+        self._last_refill = now
 
-            if not driver_pool:
-                return False
+    def try_acquire_slot(self, driver_pool=None) -> bool:
+        # pool checks read live counters and need no lock, the lock only
+        # guards the token read-modify-write and is released before logging
+        if not driver_pool:
+            return False
 
-            if driver_pool.drivers_inuse >= driver_pool.max_size:
-                monitor_details.info(f"[ACQUIRE_SLOT] denied driver pool full")
-                return False
+        if driver_pool.drivers_inuse >= driver_pool.max_size:
+            monitor_details.info("[ACQUIRE_SLOT] denied driver pool full")
+            return False
 
-            if self.spawn_count >= self.max_per_window:
-                # monitor_details.info(
-                #     f"[ACQUIRE_SLOT] denied: driver spawn "
-                #     f"budget exhausted ({self.spawn_count})"
-                # )
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
                 return False
+            self._tokens -= 1
+            remaining = self._tokens
 
-            self.spawn_count += 1
-            monitor_details.info(
-                f"[ACQUIRE_SLOT] allowed driver spawn_count={self.spawn_count}"
-            )
-            return True
+        monitor_details.info("[ACQUIRE_SLOT] allowed driver spawn, remaining=%d", remaining)
+        return True
     
+    def _projected_tokens(self) -> float:
+        # read only projection for the queries below, a slightly stale pair
+        # of reads is harmless and keeps readers off the lock
+        tokens = self._tokens
+        elapsed = time.monotonic() - self._last_refill
+        return min(self.max_per_window, tokens + max(0.0, elapsed) * self._refill_rate)
+
     def get_remaining_slots(self) -> int:
-        with self._lock:
-            now = time.monotonic()
-            if now - self.window_start > self.window_size_sec:
-                self.spawn_count = 0         
-                self.window_start = now
-                return self.max_per_window
-            return max(0, self.max_per_window - self.spawn_count)
+        return int(self._projected_tokens())
+
+    def wait_for_slot(self, driver_pool, poll_delay: float) -> None:
+        while not self.try_acquire_slot(driver_pool):
+            time.sleep(self._retry_after(poll_delay))
+
+    def _retry_after(self, poll_delay: float) -> float:
+        # sleep until the next token lands instead of polling,
+        # a full pool has no such deadline so keep the short poll
+        tokens = self._projected_tokens()
+        if tokens >= 1:
+            return poll_delay
+        return max(poll_delay, (1 - tokens) / self._refill_rate)
         
 
 class DriverPool:
     __slots__ = (
         '_lock', '_auto_mode', '_max_size', '_pool', '_drv_path', '_options', 
-        '_created', '_errors', '_info', '_driver_objects', '_termination_failures', 
-        'proxy_enabled', 'proxies', '_proxy_index', 'no_ssl_verify', 'use_auth', '_in_use', 
+        '_created', '_errors', '_info', '_termination_failures', 
+        'proxy_enabled', 'proxies', '_proxy_iter', 'no_ssl_verify', 'use_auth', '_in_use', 
         'username', 'password', 'socks5', 'dns_resolver', '_shutdown', 'high_load_count', 
         '_seleniumwire_webdriver', '_pressure_lock', '_high_load', '_rate_limiter',
-        '_near_threshold'
+        '_near_threshold', '_in_pool_ids', '_pool_lock', '_pool_maxsize', '_pool_waiters',
+        '_proxy_creds', '_proxy_scheme', '_load_cond',
+        '_slot_wait_delay', '_idle_heap', '_idle_due_at', '_sw_opts_template',
+        '_failed_drivers', '_spawning'
     )
     
     def __init__(self, max_size, firefox_options):
@@ -100,18 +151,32 @@ class DriverPool:
             self._max_size = int(max_size)
             queue_maxsize = self._max_size
         
-        self._lock = threading.Condition()
+        self._lock = threading.Lock()
+        self._load_cond = threading.Condition(threading.Lock())
         self._pressure_lock = threading.Lock()
-        self._pool = queue.Queue(maxsize=queue_maxsize)
+        self._pool = deque()
+        self._pool_lock = threading.Lock()
+        # callers blocked on an empty pool, oldest first, _park hands drivers to them directly
+        self._pool_waiters = deque()
+        self._pool_maxsize = queue_maxsize
+        # ids of drivers parked in _pool, a destroyed driver drops out of it
+        self._in_pool_ids = set()
+        # (parked_at, driver id), entries go stale once the driver is taken again
+        self._idle_heap = []
+        # oldest park time on the heap, lets cleanup_idle_drivers bail out without the lock
+        self._idle_due_at = float('inf')
         self._drv_path = os.path.join(os.path.dirname(__file__), 'geckodriver')
         
         self._options = firefox_options
         self._info = ThreadSafeDict()
-        self._driver_objects = ThreadSafeDict()
         self._in_use = AtomicCounter()
         self._created = AtomicCounter()
         self._errors = AtomicCounter()
         self._termination_failures = AtomicCounter()
+        # live drivers with failure_count > 0, kept so has_recent_failures doesn't scan _info
+        self._failed_drivers = AtomicCounter()
+        # spawns in flight, counted with _info so concurrent callers can't both take the last slot
+        self._spawning = 0
         
         self._shutdown = False
         self.high_load_count = AtomicCounter()
@@ -122,11 +187,15 @@ class DriverPool:
         spawn_window_sec = driver_spawning.get("spawn_window_sec")
         max_spawns_per_window = driver_spawning.get("max_spawns_per_window")
         self._rate_limiter = DriverRateLimiter(max_spawns_per_window, spawn_window_sec)
+        self._slot_wait_delay = Config.get("misc.timeouts.driver_slot_wait_delay")
         
         proxy_settings = Config.get("proxy")
         self.proxy_enabled = False
         self.proxies = []
-        self._proxy_index = 0
+        self._proxy_iter = None
+        self._proxy_creds = ""
+        self._proxy_scheme = "http"
+        self._sw_opts_template = {}
         self.no_ssl_verify = False
         self.use_auth = False
         self.username = None
@@ -163,9 +232,27 @@ class DriverPool:
         self.socks5 = proxy_settings.get("socks5_mode")
         self.dns_resolver = proxy_settings.get("resolve_dns_locally")
 
+        self._proxy_creds = f"{self.username}:{self.password}@" if self.use_auth else ""
+        self._proxy_scheme = "socks5" if self.socks5 else "http"
+
+        # everything but the proxy urls is fixed, _create_driver copies this per spawn
+        self._sw_opts_template = {
+            "verify_ssl": not self.no_ssl_verify,
+            "suppress_connection_errors": False,
+            "disable_encoding": True,
+            "mitm_http2": False,
+            "connection_keep_alive": proxy_settings.get("connection_keep_alive", True),
+            "connection_timeout": proxy_settings.get("connection_timeout", 20),
+            "disable_capture": not proxy_settings.get("capture_requests", False),
+        }
+        if self.dns_resolver:
+            self._sw_opts_template["dns_resolver"] = True
+
         if self.proxy_enabled:
             if self.proxies:
-                self._proxy_index = 0
+                # urls are built once so a malformed entry fails here, not on every spawn,
+                # and next() on a cycle is a single C call so concurrent spawns can't race
+                self._proxy_iter = itertools.cycle([self._format_proxy(raw) for raw in self.proxies])
             else:
                 cprint("Proxies are enabled but the proxy list is empty. No proxies will be used.", "red")
                 self.proxy_enabled = False
@@ -176,43 +263,28 @@ class DriverPool:
             raise ValueError(f"Bad proxy format: {raw!r}")
 
         host, port = raw.split(":", 1)
-        creds = f"{self.username}:{self.password}@" if self.use_auth else ""
-        scheme = "socks5" if self.socks5 else "http"
-        return f"{scheme}://{creds}{host}:{port}"
+        return f"{self._proxy_scheme}://{self._proxy_creds}{host}:{port}"
 
     def _create_driver(self):
-        driver_opts = self._options
+        # spawns run side by side in warm_up, each gets its own prefs so the user agent can't leak across
+        driver_opts = copy.copy(self._options)
+        driver_opts._preferences = dict(self._options._preferences)
+        # to_capabilities() writes the prefs into _caps in place, so that can't be shared either
+        driver_opts._caps = dict(self._options._caps)
         driver_opts.set_preference("general.useragent.override", get_random_user_agent())
         service = Service(self._drv_path, port=0)
 
         drv = None
         try:
-            selected_proxy = None
-
-            if self.proxy_enabled:
-                selected_proxy = self.proxies[self._proxy_index]
-                self._proxy_index = (self._proxy_index + 1) % len(self.proxies)
-
-            if selected_proxy:
-                px_url = self._format_proxy(selected_proxy)
-                sw_opts = {
-                    "proxy": {
-                        "http": px_url,
-                        "https": px_url,
-                        "no_proxy": "localhost,127.0.0.1",
-                    },
-                    "verify_ssl": not self.no_ssl_verify,
-                    "suppress_connection_errors": False,
-                    "disable_encoding": True,
-                    "mitm_http2": False,
-                }
+            px_url = next(self._proxy_iter) if self.proxy_enabled else None
+
+            if px_url:
+                proxy = {"http": px_url, "https": px_url, "no_proxy": "localhost,127.0.0.1"}
                 if self.socks5:
-                    sw_opts["proxy"].update({
-                        "socks_proxy": px_url,
-                        "socks_version": 5
-                    })
-                if self.dns_resolver:
-                    sw_opts["dns_resolver"] = True
+                    proxy["socks_proxy"] = px_url
+                    proxy["socks_version"] = 5
+                sw_opts = self._sw_opts_template.copy()
+                sw_opts["proxy"] = proxy
                 if self._seleniumwire_webdriver is None:
                     raise RuntimeError("selenium-wire not available for proxy support")
                 drv = self._seleniumwire_webdriver.Firefox(
@@ -228,18 +300,17 @@ class DriverPool:
             debug_logger.error(f"[DRIVER_CREATE] {e}", exc_info=debug)
             return None
 
-        pids = []
+        procs = []
         try:
             if service.process and service.process.pid:
-                pids = [service.process.pid]
+                procs = [service.process]
         except Exception as e:
             from xauto.utils.setup import debug
-            debug_logger.error(f"[DRIVER_CREATE] getting PID {e}", exc_info=debug)
+            debug_logger.error(f"[DRIVER_CREATE] getting process {e}", exc_info=debug)
 
-        self._info[id(drv)] = DriverInfo(pids)
-        self._driver_objects[id(drv)] = drv
+        did = id(drv)
+        self._info[did] = DriverInfo(drv, procs)
         self._created.increment()
-        self._info[id(drv)].last_access = time.monotonic()
 
         setattr(drv, "_driver_pool", self)
         return drv
@@ -252,13 +323,64 @@ class DriverPool:
                     return driver
             except Exception as e:
                 debug_logger.error(f"[DRIVER_CREATE_RETRIES] (attempt {attempt+1}/{max_retries}): {e}")
-            time.sleep(backoff * (2 ** attempt))
+            if attempt == max_retries - 1:
+                break
+            # jitter so drivers that failed together during warm_up don't retry in lockstep
+            time.sleep(backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
 
         debug_logger.info(f"[DRIVER_CREATE_RETRIES] failed in {max_retries} attempts")
         return None
 
-    def wait_for_unblock(self, timeout: Optional[float] = None) -> bool:
+    def warm_up(self, count: int) -> int:
+        if self._shutdown or count <= 0:
+            return 0
+
+        count = self._reserve_spawns(count)
+        if count == 0:
+            return 0
+
+        try:
+            slots = 0
+            while slots < count and self._rate_limiter.try_acquire_slot(self):
+                slots += 1
+            if slots == 0:
+                return 0
+
+            # geckodriver boot is mostly waiting on the browser, spawn them side by side
+            with ThreadPoolExecutor(max_workers=slots) as executor:
+                drivers = list(executor.map(lambda _: self._create_driver_with_retries(), range(slots)))
+        finally:
+            self._release_spawns(count)
+
+        added = 0
+        for drv in drivers:
+            if drv is None:
+                continue
+            info = self._info.get(id(drv))
+            if info is not None:
+                info.last_access = 0
+            if self._park(drv):
+                added += 1
+            else:
+                self._in_use.increment()
+                self._destroy(drv)
+
+        monitor_details.info(f"[WARM_UP] requested={count}, spawned={added}")
+        return added
+
+    def _reserve_spawns(self, count: int) -> int:
+        with self._lock:
+            free = self._max_size - len(self._info) - self._spawning
+            n = int(max(0, min(count, free)))
+            self._spawning += n
+            return n
+
+    def _release_spawns(self, count: int) -> None:
         with self._lock:
+            self._spawning -= count
+
+    def wait_for_unblock(self, timeout: Optional[float] = None) -> bool:
+        with self._load_cond:
             deadline = None if timeout is None else time.monotonic() + timeout
 
             while self._high_load:
@@ -266,12 +388,16 @@ class DriverPool:
                     remaining = deadline - time.monotonic()
                     if remaining <= 0:
                         return False
-                    self._lock.wait(timeout=remaining)
+                    self._load_cond.wait(timeout=remaining)
                 else:
-                    self._lock.wait()
+                    self._load_cond.wait()
             return True
 
+    # the monitor thread republishes both flags every tick, the unchanged case
+    # is a plain read so only real transitions take the locks
     def set_near_threshold(self, state: bool):
+        if self._near_threshold == state:
+            return
         with self._lock:
             prev = self._near_threshold
             self._near_threshold = state
@@ -279,23 +405,26 @@ class DriverPool:
                 monitor_details.info(f"[DRIVER_POOL] near_threshold: {prev} -> {state}")
 
     def set_high_load(self, state: bool):
-        with self._lock:
+        if self._high_load == state:
+            return
+        with self._load_cond:
             prev = self._high_load
             self._high_load = state
             if prev == state:
                 return
             monitor_details.info(f"[DRIVER_POOL] high_load: {prev} -> {state}")
-            self._lock.notify_all()
+            # waiters only care about load clearing, entering high load wakes nobody
+            if not state:
+                self._load_cond.notify_all()
 
+    # flags are only written under a lock, a single attribute read is atomic
     @property
     def is_near_threshold(self):
-        with self._lock:
-            return self._near_threshold
+        return self._near_threshold
 
     @property
     def is_high_load(self):
-        with self._lock:
-            return self._high_load
+        return self._high_load
 
     def get_driver_with_injection(self, timeout=None, skip_high_load_wait=False):
         drv = self.get_driver(timeout=timeout, skip_high_load_wait=skip_high_load_wait)
@@ -310,65 +439,116 @@ class DriverPool:
             return None
 
         timeout = timeout if timeout is not None else 0.1
-        drv = None
-        
-        try:
-            drv = self._pool.get(timeout=timeout)
-        except queue.Empty:
-            if self._max_size == float('inf') or self._created.get() < self._max_size:
-                
-                while not self._rate_limiter.try_acquire_slot(self):
-                    time.sleep(Config.get("misc.timeouts.driver_slot_wait_delay"))
-                
-                if not skip_high_load_wait:
-                    # this is useful if you are calling get_driver() on its own
-                    # without going through acquire_driver_with_pressure_check()
-                    from xauto.internal.memory import wait_high_load
-                    wait_high_load(self, context="driver_pool.get_driver", allow_timeout=False)
-                
-                drv = self._create_driver_with_retries()
+
+        # one wait at most, a parked driver if there is one, else spawn while under
+        # max_size, else block once for a returned driver
+        drv = self._take_pooled(0)
+        if drv is None:
+            # live drivers plus reserved spawns, _created only ever grows so destroyed
+            # slots would never free up, and a bare len check lets racing callers overshoot
+            if self._reserve_spawns(1):
+                try:
+                    self._rate_limiter.wait_for_slot(self, self._slot_wait_delay)
+                    
+                    if not skip_high_load_wait:
+                        # this is useful if you are calling get_driver() on its own
+                        # without going through acquire_driver_with_pressure_check()
+                        from xauto.internal.memory import wait_high_load
+                        wait_high_load(self, context="driver_pool.get_driver", allow_timeout=False)
+                    
+                    drv = self._create_driver_with_retries()
+                finally:
+                    self._release_spawns(1)
             else:
-                drv = self._pool.get(timeout=timeout)
+                drv = self._take_pooled(timeout)
+
+        if drv is None:
+            return None
 
         info = self._info.get(id(drv))
-        if info:
+        if info is not None:
             info.last_access = time.monotonic()
         self._in_use.increment()
         
-        stats = self._get_minimal_pool_stats()
-        monitor_details.info(
-            f"[GET_DRIVER] pool_size={stats['pool_size']}, created={stats['created']}, "
-            f"in_use={stats['in_use']}, errors={stats['errors']}, max_size={stats['max_size']}"
-        )
+        self._log_pool_stats("[GET_DRIVER]")
         return drv
 
+    def _park(self, drv) -> bool:
+        did = id(drv)
+        info = self._info.get(did)
+        with self._pool_lock:
+            if self._pool_waiters:
+                # straight to the longest waiter so a thread arriving later can't take it first
+                waiter = self._pool_waiters.popleft()
+                waiter.driver = drv
+                waiter.event.set()
+                return True
+            if len(self._pool) >= self._pool_maxsize:
+                return False
+            if info is not None:
+                info.heap_timestamp = time.monotonic()
+                heapq.heappush(self._idle_heap, (info.heap_timestamp, did))
+                self._idle_due_at = self._idle_heap[0][0]
+            self._in_pool_ids.add(did)
+            self._pool.append(drv)
+        return True
+
+    def _take_pooled(self, timeout):
+        with self._pool_lock:
+            while self._pool:
+                # LIFO, the most recently returned driver still has warm proxy sockets
+                # and cold ones stay at the left where the idle reaper ages them out
+                drv = self._pool.pop()
+                did = id(drv)
+                if did in self._in_pool_ids:
+                    self._in_pool_ids.discard(did)
+                    return drv
+                # destroyed while parked, e.g. by cleanup_idle_drivers, skip the dead handle
+
+            if timeout <= 0 or self._shutdown:
+                return None
+            waiter = _PoolWaiter()
+            self._pool_waiters.append(waiter)
+
+        waiter.event.wait(timeout)
+
+        with self._pool_lock:
+            if waiter.driver is None:
+                try:
+                    self._pool_waiters.remove(waiter)
+                except ValueError:
+                    pass
+            # a handoff that lands between the timeout and this lock is still ours
+            return waiter.driver
+
     def return_driver(self, drv):
         if drv is None:
             return
 
         info = self._info.get(id(drv))
-        if info:
+        if info is not None:
             info.last_access = 0
-        self._in_use.decrement()
 
-        try:
-            self._pool.put_nowait(drv)
-        except queue.Full:
-            debug_logger.info("[RETURN_DRIVER] pool full, destroying driver")
-            self._destroy(drv)
+        if self._park(drv):
+            self._in_use.decrement()
             return
 
+        debug_logger.info("[RETURN_DRIVER] pool full, destroying driver")
+        self._destroy(drv)
+
     def mark_driver_failed(self, driver):
         if driver is None:
             return
 
         info = self._info.get(id(driver))
-        if info:
+        if info is not None:
+            if info.failure_count == 0:
+                self._failed_drivers.increment()
             info.failure_count += 1
         self._errors.increment()
 
     def has_recent_failures(self):
-        return any(info.failure_count > 0 for info in self._info.values())
+        return self._failed_drivers.get() > 0
 
     def set_consecutive_high_load(self, is_high_load):
         if is_high_load:
@@ -381,42 +561,36 @@ class DriverPool:
             return
 
         driver_id = id(drv)
-        stats = self._get_minimal_pool_stats()
-        monitor_details.info(
-            f"[DRIVER_DESTROY] START: driver_id={driver_id}, "
-            f"pool_size={stats['pool_size']}, created={stats['created']}, "
-            f"in_use={stats['in_use']}, errors={stats['errors']}, max_size={stats['max_size']}"
-        )
+        self._log_pool_stats("[DRIVER_DESTROY] START: driver_id=%s,", driver_id)
 
         try:
-            info = self._info.get(driver_id)
-            if info:
-                pids = info.pids
-            else:
-                pids = []
-            self._info.pop(driver_id, None)
-            self._driver_objects.pop(driver_id, None)
-            self._in_use.decrement()
+            info = self._info.pop(driver_id, None)
+            procs = info.procs if info is not None else ()
+            if info is not None and info.failure_count > 0:
+                self._failed_drivers.decrement()
+            with self._pool_lock:
+                parked = driver_id in self._in_pool_ids
+                self._in_pool_ids.discard(driver_id)
+            if not parked:
+                self._in_use.decrement()
 
             try:
                 drv.quit()
-                monitor_details.info(f"[DRIVER_DESTROY] quit_success: driver_id={driver_id}")
+                monitor_details.info("[DRIVER_DESTROY] quit_success: driver_id=%s", driver_id)
             except Exception as e:
                 debug_logger.error(f"[DRIVER_DESTROY] quit_failed: driver_id={driver_id}, error={e}")
 
-            for pid in pids:
+            for proc in procs:
+                pid = proc.pid
                 try:
-                    process = psutil.Process(pid)
-                    if process.is_running():
-                        process.terminate()
-                        try:
-                            process.wait(timeout=5)
-                            monitor_details.info(f"[DRIVER_DESTROY] process_terminated: driver_id={driver_id}, pid={pid}")
-                        except psutil.TimeoutExpired:
-                            process.kill()
-                            monitor_details.info(f"[DRIVER_DESTROY] process_killed: driver_id={driver_id}, pid={pid}")
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    debug_logger.error(f"[DRIVER_DESTROY] process already dead: driver_id={driver_id}, pid={pid}")
+                    outcome = _stop_process(proc)
+                    if outcome == "gone":
+                        # the normal case, quit() already stopped the service
+                        debug_logger.debug("[DRIVER_DESTROY] process already exited: driver_id=%s, pid=%s", driver_id, pid)
+                    else:
+                        monitor_details.info("[DRIVER_DESTROY] process_%s: driver_id=%s, pid=%s", outcome, driver_id, pid)
+                except PermissionError:
+                    debug_logger.error(f"[DRIVER_DESTROY] process not ours: driver_id={driver_id}, pid={pid}")
                 except Exception as e:
                     debug_logger.error(f"[DRIVER_DESTROY] process error: driver_id={driver_id}, pid={pid}, error={e}")
 
@@ -424,12 +598,7 @@ class DriverPool:
             self._termination_failures.increment()
             debug_logger.error(f"[DRIVER_DESTROY] {driver_id} {e}")
 
-        stats = self._get_minimal_pool_stats()
-        monitor_details.info(
-            f"[DRIVER_DESTROY] END: driver_id={driver_id}, "
-            f"pool_size={stats['pool_size']}, created={stats['created']}, "
-            f"in_use={stats['in_use']}, errors={stats['errors']}, max_size={stats['max_size']}"
-        )
+        self._log_pool_stats("[DRIVER_DESTROY] END: driver_id=%s,", driver_id)
 
     def close_all(self):
         if self._shutdown:
@@ -437,60 +606,82 @@ class DriverPool:
             
         self._shutdown = True
         
-        while True:
-            try:
-                drv = self._pool.get_nowait()
-                if drv is not None:
-                    self._destroy(drv)
-            except queue.Empty:
-                break
-        
-        drivers_to_destroy = self._driver_objects.items()
-        
-        for drv_id, driver in drivers_to_destroy:
+        # every live driver, parked or checked out, has an entry in _info
+        # parked drivers are claimed off the pool together with their ids and heap
+        # entries, so a concurrent idle cleanup finds nothing stale to remove
+        with self._pool_lock:
+            parked = len(self._in_pool_ids)
+            self._pool.clear()
+            self._in_pool_ids.clear()
+            self._idle_heap.clear()
+            self._idle_due_at = float('inf')
+            # let callers blocked in _take_pooled give up now instead of at their timeout
+            while self._pool_waiters:
+                self._pool_waiters.popleft().event.set()
+        # claimed drivers count as checked out for _destroy, like idle cleanup
+        for _ in range(parked):
+            self._in_use.increment()
+        self._destroy_many([info.driver for info in self._info.values()], "CLOSE_ALL")
+
+    def _destroy_many(self, drivers, tag):
+        if not drivers:
+            return
+
+        def destroy(driver):
             try:
                 self._destroy(driver)
             except Exception as e:
                 from xauto.utils.setup import debug
-                debug_logger.error(f"[CLOSE_ALL] {drv_id} {e}", exc_info=debug)
+                debug_logger.error(f"[{tag}] {id(driver)} {e}", exc_info=debug)
+
+        if len(drivers) == 1:
+            destroy(drivers[0])
+            return
+
+        # quit() and the pid waits are independent, tear the drivers down side by side
+        with ThreadPoolExecutor(max_workers=min(32, len(drivers))) as executor:
+            list(executor.map(destroy, drivers))
         
     def cleanup_idle_drivers(self, max_idle_time=30):
         if self._shutdown:
             return
 
-        current_time = time.monotonic()
+        cutoff = time.monotonic() - max_idle_time
+        if self._idle_due_at >= cutoff:
+            return
         drivers_to_remove = []
 
-        for driver_id, info in self._info.items():
-            if info.last_access > 0:
-                continue 
-            if current_time - info.last_access > max_idle_time:
-                drivers_to_remove.append(driver_id)
+        # only entries past the cutoff are popped, the rest of the pool is never touched
+        with self._pool_lock:
+            heap = self._idle_heap
+            while heap and heap[0][0] < cutoff:
+                parked_at, driver_id = heapq.heappop(heap)
+                if driver_id not in self._in_pool_ids:
+                    continue
+                info = self._info.get(driver_id)
+                if info is None or info.heap_timestamp != parked_at:
+                    continue
+                driver = info.driver
+                # claim it so get_driver can't hand it out while it is being destroyed
+                self._in_pool_ids.discard(driver_id)
+                try:
+                    self._pool.remove(driver)
+                except ValueError:
+                    continue
+                drivers_to_remove.append(driver)
+            self._idle_due_at = heap[0][0] if heap else float('inf')
 
         if not drivers_to_remove:
             return
 
-        stats = self._get_minimal_pool_stats()
-        monitor_details.info(
-            f"[IDLE_DRIVERS] START: removing={len(drivers_to_remove)}, "
-            f"pool_size={stats['pool_size']}, created={stats['created']}, "
-            f"in_use={stats['in_use']}, errors={stats['errors']}, max_size={stats['max_size']}"
-        )
+        self._log_pool_stats("[IDLE_DRIVERS] START: removing=%s,", len(drivers_to_remove))
 
-        for driver_id in drivers_to_remove:
-            try:
-                driver = self._driver_objects.get(driver_id)
-                if driver:
-                    self._destroy(driver)
-            except Exception as e:
-                debug_logger.error(f"[IDLE_DRIVERS] {e}")
+        # claimed drivers are off the pool, count them as checked out for _destroy
+        for _ in drivers_to_remove:
+            self._in_use.increment()
+        self._destroy_many(drivers_to_remove, "IDLE_DRIVERS")
 
-        stats = self._get_minimal_pool_stats()
-        monitor_details.info(
-            f"[IDLE_DRIVERS] END: removing={len(drivers_to_remove)}, "
-            f"pool_size={stats['pool_size']}, created={stats['created']}, "
-            f"in_use={stats['in_use']}, errors={stats['errors']}, max_size={stats['max_size']}"
-        )
+        self._log_pool_stats("[IDLE_DRIVERS] END: removing=%s,", len(drivers_to_remove))
 
     @property
     def drivers_inuse(self):
@@ -525,6 +716,10 @@ class DriverPool:
             self.mark_driver_failed(driver)
 
     def should_close_driver_for_pressure(self):
+        # common case, no sustained high load, answer without the lock
+        if self.high_load_count.get() < 2:
+            return False
+
         with self._pressure_lock:
             if self.has_recent_failures():
                 return False
@@ -564,19 +759,20 @@ class DriverPool:
 
         return True
 
-    def _get_minimal_pool_stats(self):
-        return {
-            "pool_size": self._pool.qsize(),
-            "created": self._created.get(),
-            "in_use": self._in_use.get(),
-            "errors": self._errors.get(),
-            "max_size": self._max_size if self._max_size != float('inf') else "inf",
-        }
-    
+    def _log_pool_stats(self, prefix, *args):
+        # stats are only gathered when the record will actually be emitted
+        if not monitor_details.isEnabledFor(logging.INFO):
+            return
+        max_size = self._max_size if self._max_size != float('inf') else "inf"
+        monitor_details.info(
+            prefix + " pool_size=%d, created=%d, in_use=%d, errors=%d, max_size=%s",
+            *args, len(self._pool), self._created.get(), self._in_use.get(), self._errors.get(), max_size
+        )
+
     def get_pool_stats(self):
         with self._lock:
             return {
-                'pool_size': self._pool.qsize(),
+                'pool_size': len(self._pool),
                 'created': self._created.get(),
                 'in_use': self._in_use.get(),
                 'errors': self._errors.get(),
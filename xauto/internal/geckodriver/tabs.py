@@ -0,0 +1,50 @@
+from xauto.utils.logging import debug_logger
+
+from contextlib import contextmanager
+from typing import Any, Callable, Generator, List
+import threading
+
+class TabbedDriver:
+    __slots__ = ('driver', '_handles', '_lock')
+
+    def __init__(self, driver: Any, tabs: int = 8):
+        self.driver = driver
+        self._lock = threading.Lock()
+        self._handles: List[str] = [driver.current_window_handle]
+
+        for _ in range(max(0, tabs - 1)):
+            driver.switch_to.new_window('tab')
+            self._handles.append(driver.current_window_handle)
+        driver.switch_to.window(self._handles[0])
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    @contextmanager
+    def tab(self, tab_id: int) -> Generator[Any, None, None]:
+        # a webdriver session has one focused window, callers take turns on it
+        with self._lock:
+            self.driver.switch_to.window(self._handles[tab_id % len(self._handles)])
+            yield self.driver
+
+    def get(self, url: str, tab_id: int) -> None:
+        with self.tab(tab_id) as driver:
+            driver.get(url)
+
+    def run(self, tab_id: int, fn: Callable[[Any], Any]) -> Any:
+        with self.tab(tab_id) as driver:
+            return fn(driver)
+
+    def close_tabs(self) -> None:
+        with self._lock:
+            for handle in self._handles[1:]:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except Exception as e:
+                    debug_logger.error(f"[TABBED_DRIVER] close tab {handle}: {e}")
+            del self._handles[1:]
+            try:
+                self.driver.switch_to.window(self._handles[0])
+            except Exception as e:
+                debug_logger.error(f"[TABBED_DRIVER] switch back: {e}")
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-from xauto.internal.thread_safe import ThreadSafeList
 from xauto.utils.logging import debug_logger, monitor_details
 from xauto.utils.config import Config
 from xauto.utils.setup import debug
@@ -8,53 +7,54 @@ from xauto.internal.dataclasses import ResourceStats
 from xauto.utils.utility import open_file_ro, LogTimer
 
 from typing import Any, Optional, Tuple
+from array import array
 import threading
+import logging
+import errno
+import atexit
 import time
 import os
 
 _memory_monitor: Optional["MemoryMonitor"] = None
-_memory_monitor_lock = threading.RLock()
-_meminfo_fd = None
-_stat_fd = None
-_fd_lock = threading.RLock()
+_memory_monitor_lock = threading.Lock()
+_blocking_config: Optional[Tuple[float, float, float]] = None
+# opened once for the life of the process, O_CLOEXEC via open_file_ro, None off linux
+_meminfo_fd = open_file_ro("/proc/meminfo")
+_stat_fd = open_file_ro("/proc/stat")
 _meminfo_buf = bytearray(4096)
-_stat_buf = bytearray(1024)
-
-def _get_meminfo_fd():
-    global _meminfo_fd
-    with _fd_lock:
-        if _meminfo_fd is None:
-            try:
-                _meminfo_fd = open_file_ro("/proc/meminfo")
-            except OSError:
-                _meminfo_fd = None
-        return _meminfo_fd
-
-def _get_stat_fd():
-    global _stat_fd
-    with _fd_lock:
-        if _stat_fd is None:
-            try:
-                _stat_fd = open_file_ro("/proc/stat")
-            except OSError:
-                _stat_fd = None
-        return _stat_fd
+# only the aggregate "cpu " line is parsed, it is well under 256 bytes
+_stat_buf = bytearray(256)
+# a missing or bad fd is reopened at most once per backoff instead of reporting 0% forever
+_FD_REOPEN_BACKOFF = 5.0
+_fd_retry_at = 0.0
+_fd_reopen_lock = threading.Lock()
 
 def _cleanup_fds():
     global _meminfo_fd, _stat_fd
-    with _fd_lock:
-        if _meminfo_fd is not None:
+    for fd in (_meminfo_fd, _stat_fd):
+        if fd is not None:
             try:
-                os.close(_meminfo_fd)
+                os.close(fd)
             except OSError:
                 pass
-            _meminfo_fd = None
-        if _stat_fd is not None:
-            try:
-                os.close(_stat_fd)
-            except OSError:
-                pass
-            _stat_fd = None
+    _meminfo_fd = None
+    _stat_fd = None
+
+atexit.register(_cleanup_fds)
+
+def _reopen_fds() -> None:
+    global _meminfo_fd, _stat_fd, _fd_retry_at
+    now = time.monotonic()
+    if now < _fd_retry_at or not _fd_reopen_lock.acquire(blocking=False):
+        return
+    try:
+        _fd_retry_at = now + _FD_REOPEN_BACKOFF
+        if _meminfo_fd is None:
+            _meminfo_fd = open_file_ro("/proc/meminfo")
+        if _stat_fd is None:
+            _stat_fd = open_file_ro("/proc/stat")
+    finally:
+        _fd_reopen_lock.release()
 
 def get_memory_monitor(reset=False):
     global _memory_monitor
@@ -67,84 +67,119 @@ def get_memory_monitor(reset=False):
         return _memory_monitor
 
 def cleanup_memory_monitor():
-    global _memory_monitor
+    global _memory_monitor, _blocking_config
     
     with _memory_monitor_lock:
         if _memory_monitor is not None:
             _memory_monitor.cleanup()
             _memory_monitor = None
-    _cleanup_fds()
-
-def _read_memory_percent() -> float:
-    fd = _get_meminfo_fd()
-    if fd is None:
+    # re-read on the next runtime in case config changed in between
+    _blocking_config = None
+
+# listed in the order the kernel prints them so one forward pass finds them all,
+# the leading newline keeps "Cached:" from matching "SwapCached:"
+_MEMINFO_KEYS = (b"MemTotal:", b"\nMemFree:", b"\nBuffers:", b"\nCached:", b"\nShmem:", b"\nSReclaimable:")
+
+def _meminfo_value(buf, key: bytes, start: int, end: int) -> Tuple[int, int]:
+    i = buf.find(key, start, end)
+    if i < 0:
+        # out of the usual order, fall back to a search from the top
+        i = buf.find(key, 0, start)
+        if i < 0:
+            return 0, start
+    i += len(key)
+    j = buf.find(b" kB", i, end)
+    if j < 0:
+        return 0, start
+    # int() skips the padding between the colon and the value
+    return int(buf[i:j]), j
+
+# cpu samples are kept as (total, idle) jiffies, summed once when parsed
+# instead of re-summing both 8 field snapshots on every delta
+_ZERO_CPU_TIMES = (0, 0)
+
+def _parse_memory_percent(buf, n: int) -> float:
+    if not n:
         return 0.0
-    
     try:
-        os.lseek(fd, 0, os.SEEK_SET)
-        data = os.read(fd, len(_meminfo_buf))
-        if not data:
-            return 0.0
-
-        lines = data.decode("utf-8").splitlines()
-        meminfo = {}
-        for line in lines:
-            if ':' not in line:
-                continue
-            key, val = line.split(':', 1)
-            key = key.strip()
-            try:
-                meminfo[key] = int(val.strip().split()[0])
-            except (ValueError, IndexError):
-                continue
-
-        total = meminfo.get("MemTotal", 0)
-        free = (
-            meminfo.get("MemFree", 0) +
-            meminfo.get("Buffers", 0) +
-            meminfo.get("Cached", 0) +
-            meminfo.get("SReclaimable", 0) -
-            meminfo.get("Shmem", 0)
-        )
+        # scan the raw buffer for the few keys we need instead of decoding every line,
+        # each search resumes where the previous key was found
+        values = []
+        pos = 0
+        for key in _MEMINFO_KEYS:
+            value, pos = _meminfo_value(buf, key, pos, n)
+            values.append(value)
+        total, mem_free, buffers, cached, shmem, reclaimable = values
+        free = mem_free + buffers + cached + reclaimable - shmem
         used = total - free
         return (used / total) * 100.0 if total else 0.0
     except Exception:
         return 0.0
 
-def _read_cpu_times() -> Tuple[int, ...]:
-    fd = _get_stat_fd()
-    if fd is None:
-        return (0, 0, 0, 0, 0, 0, 0, 0)
-    
+def _parse_cpu_times(buf, n: int) -> Tuple[int, int]:
+    # the aggregate "cpu " line is always first, split only that line
+    # and let int() take the bytes directly instead of decoding the file
+    if not n or not buf.startswith(b"cpu "):
+        return _ZERO_CPU_TIMES
     try:
-        os.lseek(fd, 0, os.SEEK_SET)
-        data = os.read(fd, len(_stat_buf))
-        if not data:
-            return (0, 0, 0, 0, 0, 0, 0, 0)
-
-        lines = data.decode('utf-8').split('\n')
-        for line in lines:
-            if line.startswith("cpu "):
-                fields = line.split()[1:9]  
-                if len(fields) == 8:
-                    return tuple(map(int, fields))
-                break
-        return (0, 0, 0, 0, 0, 0, 0, 0)
+        nl = buf.find(b"\n", 0, n)
+        fields = buf[4:n if nl < 0 else nl].split()
+        if len(fields) < 8:
+            return _ZERO_CPU_TIMES
+        times = tuple(map(int, fields[:8]))
+        return sum(times), times[3] + times[4]
     except Exception:
-        return (0, 0, 0, 0, 0, 0, 0, 0)
+        return _ZERO_CPU_TIMES
 
-def _calculate_cpu_percent(prev: Tuple[int, ...], curr: Tuple[int, ...]) -> float:
-    if len(prev) < 8 or len(curr) < 8:
-        return 0.0
-    
-    prev_idle = prev[3] + prev[4]  
-    curr_idle = curr[3] + curr[4]  
+# positional reads leave the shared offset alone, no lseek and no lock needed,
+# EINTR is already retried by os itself so only a dead fd needs handling
+def _pread_meminfo(fd) -> int:
+    global _meminfo_fd
+    try:
+        return os.preadv(fd, [_meminfo_buf], 0)
+    except OSError as e:
+        if e.errno == errno.EBADF:
+            _meminfo_fd = None
+        return 0
 
-    prev_total = sum(prev)
-    curr_total = sum(curr)
+def _pread_stat(fd) -> int:
+    global _stat_fd, _stat_buf
+    try:
+        n = os.preadv(fd, [_stat_buf], 0)
+        # the first line did not fit, grow the buffer for good and read again
+        while n == len(_stat_buf) and _stat_buf.find(b"\n", 0, n) < 0:
+            _stat_buf = bytearray(len(_stat_buf) * 2)
+            n = os.preadv(fd, [_stat_buf], 0)
+        return n
+    except OSError as e:
+        if e.errno == errno.EBADF:
+            _stat_fd = None
+        return 0
 
-    total_delta = curr_total - prev_total
-    idle_delta = curr_idle - prev_idle
+def _read_cpu_times() -> Tuple[int, int]:
+    if _stat_fd is None:
+        _reopen_fds()
+    fd = _stat_fd
+    if fd is None:
+        return _ZERO_CPU_TIMES
+    # read first, the call may swap in a larger _stat_buf
+    n = _pread_stat(fd)
+    return _parse_cpu_times(_stat_buf, n)
+
+def _read_proc_stats() -> Tuple[float, Tuple[int, int]]:
+    # issue both reads back to back and parse afterwards, so the two
+    # snapshots are taken as close together as possible
+    if _meminfo_fd is None or _stat_fd is None:
+        _reopen_fds()
+    mem_fd = _meminfo_fd
+    stat_fd = _stat_fd
+    n = _pread_meminfo(mem_fd) if mem_fd is not None else 0
+    m = _pread_stat(stat_fd) if stat_fd is not None else 0
+    return _parse_memory_percent(_meminfo_buf, n), _parse_cpu_times(_stat_buf, m)
+
+def _calculate_cpu_percent(prev: Tuple[int, int], curr: Tuple[int, int]) -> float:
+    total_delta = curr[0] - prev[0]
+    idle_delta = curr[1] - prev[1]
 
     if total_delta == 0:
         return 0.0
@@ -153,11 +188,12 @@ def _calculate_cpu_percent(prev: Tuple[int, ...], curr: Tuple[int, ...]) -> floa
 
 class MemoryMonitor:
     __slots__ = (
-        '_check_interval', '_max_history', '_state_lock', '_base_pos', '_base_neg',
-        '_update_in_progress', '_history_memory', '_history_cpu', '_last_cpu_times', 
+        '_check_interval', '_min_poll_interval', '_max_history', '_update_lock', '_base_pos', '_base_neg',
+        '_hist_mem_buf', '_hist_cpu_buf', '_hist_idx', '_hist_len',
+        '_hist_mem_sum', '_hist_cpu_sum', '_last_cpu_times',
         '_dynamic_buffer', '_base_mem_threshold', '_base_cpu_threshold', '_last_check',
         '_last_high_load_change', '_spawn_buffer', '_high_load_state', '_avg_stats',
-        '_last_stats', '_log_limiter', '_safe_margin'
+        '_last_stats', '_log_limiter', '_safe_margin', '_mem_near_cutoff', '_cpu_near_cutoff'
     )
     
     def __init__(self):
@@ -165,53 +201,63 @@ class MemoryMonitor:
 
         pressure = Config.get("resources.memory_tuning.pressure")
         self._check_interval = pressure.get("system_check_interval")
+        self._min_poll_interval = pressure.get("min_poll_interval", 0.25)
         self._max_history = pressure.get("history")    
         self._base_mem_threshold = pressure.get("mem_threshold")
         self._base_cpu_threshold = pressure.get("cpu_threshold")
         self._safe_margin = pressure.get("safe_margin")
+        self._mem_near_cutoff = self._base_mem_threshold - self._safe_margin
+        self._cpu_near_cutoff = self._base_cpu_threshold - self._safe_margin
 
         buffer = Config.get("resources.memory_tuning.buffer")
         self._base_neg = buffer.get("down_margin")
         self._base_pos = buffer.get("up_margin")
         self._spawn_buffer = Config.get("resources.driver_autoscaling.spawn_buffer")
 
-        self._history_memory = ThreadSafeList(max_size=self._max_history)
-        self._history_cpu = ThreadSafeList(max_size=self._max_history)
+        # fixed size rings with running sums, only _update_stats writes them
+        # and it already runs under _update_lock, so no per-append lock
+        self._hist_mem_buf = array('d', [0.0]) * self._max_history
+        self._hist_cpu_buf = array('d', [0.0]) * self._max_history
+        self._hist_idx = 0
+        self._hist_len = 0
+        self._hist_mem_sum = 0.0
+        self._hist_cpu_sum = 0.0
         
         self._dynamic_buffer = DynamicBuffer()
-        self._state_lock = threading.RLock()
+        self._update_lock = threading.Lock()
         self._last_cpu_times = _read_cpu_times()
         self._last_stats = ResourceStats(0.0, 0.0)
         self._avg_stats = ResourceStats(0.0, 0.0)
         self._last_check = 0.0
-        
-        self._update_in_progress = False
         self._last_high_load_change = 0.0
         self._high_load_state = False
 
     def get_resource_stats(self) -> ResourceStats:
-        if self._needs_update():
-            self._update_stats()
+        now = time.monotonic()
+        if self._needs_update(now):
+            self._update_stats(now)
         return self._last_stats
     
     def get_avg_stats(self) -> ResourceStats:
-        if self._needs_update():
-            self._update_stats()
+        now = time.monotonic()
+        if self._needs_update(now):
+            self._update_stats(now)
         return self._avg_stats
     
     def cleanup(self):
         try:
-            self._history_memory.clear()
-            self._history_cpu.clear()
-            with self._state_lock:
-                self._last_cpu_times = (0, 0, 0, 0, 0, 0, 0, 0)
+            with self._update_lock:
+                self._clear_history()
+                self._last_cpu_times = _ZERO_CPU_TIMES
                 self._last_stats = ResourceStats(0.0, 0.0)
                 self._avg_stats = ResourceStats(0.0, 0.0)
         except Exception as e:
             debug_logger.error(f"[CLEANUP] {e}", exc_info=debug)
 
     def check_load(self, driver_pool=None):
-        self._update_stats()
+        # one clock read per check, shared by the stats update and the state change timing
+        now = time.monotonic()
+        self._update_stats(now)
 
         cur_mem = self._last_stats.memory
         cur_cpu = self._last_stats.cpu
@@ -221,48 +267,32 @@ class MemoryMonitor:
         base_cpu = self._base_cpu_threshold
 
         down_margin, up_margin = self._dynamic_buffer(avg_mem, avg_cpu, self._base_neg, self._base_pos)
+        mem_block = base_mem + up_margin
+        cpu_block = base_cpu + up_margin
+        mem_release = base_mem - down_margin
+        cpu_release = base_cpu - down_margin
         
-        if self._log_limiter.should_log():
+        # %-style args are only formatted when the record is emitted
+        if monitor_details.isEnabledFor(logging.INFO) and self._log_limiter.should_log():
             monitor_details.info(
-                f"[CHECK_LOAD] cur_mem={cur_mem:.1f}%, "
-                f"avg_mem={avg_mem:.1f}%, "
-                f"cur_cpu={cur_cpu:.1f}%, "
-                f"avg_cpu={avg_cpu:.1f}%"
+                "[CHECK_LOAD] cur_mem=%.1f%%, avg_mem=%.1f%%, cur_cpu=%.1f%%, avg_cpu=%.1f%%",
+                cur_mem, avg_mem, cur_cpu, avg_cpu
             )
             monitor_details.info(
-                f"[CHECK_LOAD] block at: "
-                f"mem={base_mem + up_margin:.1f}%, "
-                f"cpu={base_cpu + up_margin:.1f}% "
-                f"up_margin={up_margin}"
+                "[CHECK_LOAD] block at: mem=%.1f%%, cpu=%.1f%% up_margin=%s",
+                mem_block, cpu_block, up_margin
             )
             monitor_details.info(
-                f"[CHECK_LOAD] release at: "
-                f"mem={base_mem - down_margin:.1f}%, "
-                f"cpu={base_cpu - down_margin:.1f}% "
-                f"down_margin={down_margin}"
+                "[CHECK_LOAD] release at: mem=%.1f%%, cpu=%.1f%% down_margin=%s",
+                mem_release, cpu_release, down_margin
             )
 
-        near_threshold = any([
-            avg_mem >= (base_mem - self._safe_margin),
-            avg_cpu >= (base_cpu - self._safe_margin)
-        ])
-
-        spike_block = any([
-            cur_mem > (base_mem + up_margin),
-            cur_cpu > (base_cpu + up_margin)
-        ])
-
-        trend_block = any([
-            avg_mem > (base_mem + up_margin),
-            avg_cpu > (base_cpu + up_margin)
-        ])
-
-        release_ok = any([
-            avg_mem <= (base_mem - down_margin),
-            avg_cpu <= (base_cpu - down_margin)
-        ])
+        # near threshold cutoffs are fixed, computed once in __init__
+        near_threshold = avg_mem >= self._mem_near_cutoff or avg_cpu >= self._cpu_near_cutoff
+        spike_block = cur_mem > mem_block or cur_cpu > cpu_block
+        trend_block = avg_mem > mem_block or avg_cpu > cpu_block
+        release_ok = avg_mem <= mem_release or avg_cpu <= cpu_release
 
-        now = time.monotonic()
         since = now - self._last_high_load_change
 
         if self._high_load_state:
@@ -275,13 +305,13 @@ class MemoryMonitor:
                 self._high_load_state = False
                 self._last_high_load_change = now
                 monitor_details.info(
-                    f"[CHECK_LOAD] high_load = False (unblocked: avg_mem={avg_mem:.1f}%, avg_cpu={avg_cpu:.1f}%)"
+                    "[CHECK_LOAD] high_load = False (unblocked: avg_mem=%.1f%%, avg_cpu=%.1f%%)", avg_mem, avg_cpu
                 )
             elif not self._high_load_state and high_load:
                 self._high_load_state = True
                 self._last_high_load_change = now
                 monitor_details.info(
-                    f"[CHECK_LOAD] high_load = True (blocked: avg_mem={avg_mem:.1f}%, avg_cpu={avg_cpu:.1f}%)"
+                    "[CHECK_LOAD] high_load = True (blocked: avg_mem=%.1f%%, avg_cpu=%.1f%%)", avg_mem, avg_cpu
                 )
 
         if driver_pool:
@@ -291,36 +321,63 @@ class MemoryMonitor:
 
         return self._high_load_state
     
-    def _needs_update(self) -> bool:
-        return time.monotonic() - self._last_check > self._check_interval
+    def _clear_history(self):
+        # stale slots are never read before being overwritten, resetting the
+        # cursor and sums is enough and the buffers are left as they are
+        self._hist_idx = 0
+        self._hist_len = 0
+        self._hist_mem_sum = 0.0
+        self._hist_cpu_sum = 0.0
+
+    def _needs_update(self, now: Optional[float] = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+        return now - self._last_check > self._check_interval
     
-    def _update_stats(self):
-        with self._state_lock:
-            if self._update_in_progress:
-                return
-            
-            self._update_in_progress = True
-            try:
-                memory_percent = _read_memory_percent()
-                curr_cpu = _read_cpu_times()
-                cpu_percent = _calculate_cpu_percent(self._last_cpu_times, curr_cpu)
-                self._last_cpu_times = curr_cpu
-                self._last_check = time.monotonic()
-                
-                self._history_memory.bounded_append(memory_percent, self._max_history)
-                self._history_cpu.bounded_append(cpu_percent, self._max_history)
-
-                self._avg_stats = ResourceStats(
-                    self._history_memory.rolling_sum / len(self._history_memory),
-                    self._history_cpu.rolling_sum / len(self._history_cpu)
-                )
+    def _update_stats(self, now: Optional[float] = None):
+        if now is None:
+            now = time.monotonic()
 
-                self._last_stats = ResourceStats(memory_percent, cpu_percent)
+        # check_load polls unconditionally, the floor caps /proc reads no matter how
+        # often it is called and keeps cpu deltas from being taken over tiny windows
+        if now - self._last_check < self._min_poll_interval:
+            return
 
-            except Exception as e:
-                debug_logger.error(f"[UPDATE_STATS] {e}", exc_info=debug)
-            finally:
-                self._update_in_progress = False
+        # try-lock, a concurrent caller skips the poll and keeps the last stats
+        if not self._update_lock.acquire(blocking=False):
+            return
+
+        try:
+            memory_percent, curr_cpu = _read_proc_stats()
+            cpu_percent = _calculate_cpu_percent(self._last_cpu_times, curr_cpu)
+            self._last_cpu_times = curr_cpu
+            self._last_check = now
+
+            # only evict from the sums once the ring is full
+            idx = self._hist_idx
+            if self._hist_len == self._max_history:
+                self._hist_mem_sum -= self._hist_mem_buf[idx]
+                self._hist_cpu_sum -= self._hist_cpu_buf[idx]
+            else:
+                self._hist_len += 1
+            self._hist_mem_sum += memory_percent
+            self._hist_cpu_sum += cpu_percent
+            self._hist_mem_buf[idx] = memory_percent
+            self._hist_cpu_buf[idx] = cpu_percent
+            idx += 1
+            self._hist_idx = 0 if idx == self._max_history else idx
+
+            self._avg_stats = ResourceStats(
+                self._hist_mem_sum / self._hist_len,
+                self._hist_cpu_sum / self._hist_len
+            )
+
+            self._last_stats = ResourceStats(memory_percent, cpu_percent)
+
+        except Exception as e:
+            debug_logger.error(f"[UPDATE_STATS] {e}", exc_info=debug)
+        finally:
+            self._update_lock.release()
 
 
 class DynamicBuffer:
@@ -329,6 +386,7 @@ class DynamicBuffer:
         self._positive_buffer = None
         self._last_buffer_adjust_time = 0.0
         self._scale_down_cooldown = Config.get("resources.driver_autoscaling.scale_down_cooldown", 5.0)
+        self._adjust_rate = Config.get("resources.memory_tuning.buffer").get("adjust_rate", 2)
 
     def __call__(self, avg_mem, avg_cpu, base_buffer_negative, base_buffer_positive):
         if self._negative_buffer is None or self._positive_buffer is None:
@@ -340,8 +398,7 @@ class DynamicBuffer:
             return self._negative_buffer, self._positive_buffer
 
         self._last_buffer_adjust_time = now
-        buffer_cfg = Config.get("resources.memory_tuning.buffer")
-        adjust_rate = buffer_cfg.get("adjust_rate", 2)
+        adjust_rate = self._adjust_rate
 
         if avg_mem > 80 and avg_cpu > 80:
             self._negative_buffer = min(1, self._negative_buffer + adjust_rate)  
@@ -383,40 +440,57 @@ def acquire_driver_with_pressure_check(driver_pool, context="unknown"):
         debug_logger.error(f"[ACQUIRE_DRIVER] {context}: {e}", exc_info=debug)
         return None
     
+def _pressure_blocking_config() -> Tuple[float, float, float]:
+    # resolved on the first blocked call, config is frozen by the time drivers are requested
+    global _blocking_config
+    if _blocking_config is None:
+        block_cfg = Config.get("resources.memory_tuning.pressure_blocking")
+        _blocking_config = (
+            block_cfg.get("max_wait_time"),
+            block_cfg.get("wait_chunk_time"),
+            Config.get("misc.logging.log_timer_interval"),
+        )
+    return _blocking_config
+
 def wait_high_load(driver_pool: Any, context: str = "unknown", allow_timeout: bool = True) -> bool:
-    block_cfg = Config.get("resources.memory_tuning.pressure_blocking")
-    max_wait_time = block_cfg.get("max_wait_time")
-    wait_chunk_time = block_cfg.get("wait_chunk_time")
+    # get_driver calls this on every spawn, skip the config reads and stats snapshots when there is nothing to wait for
+    if not driver_pool.is_high_load:
+        return True
 
-    _log_limiter = LogTimer() 
+    max_wait_time, wait_chunk_time, log_interval = _pressure_blocking_config()
+
+    _log_limiter = LogTimer(log_interval) 
+    # pool stats take the pool lock, only gather them when the record is emitted
+    log_info = monitor_details.isEnabledFor(logging.INFO)
     
     wait_start = time.monotonic()
-    pool_stats = driver_pool.get_pool_stats()
-    monitor_details.info(
-        f"[HIGH_LOAD] START {context}, high_load={driver_pool.is_high_load}, pool_stats={pool_stats}"
-    )
+    if log_info:
+        monitor_details.info(
+            "[HIGH_LOAD] START %s, high_load=%s, pool_stats=%s",
+            context, driver_pool.is_high_load, driver_pool.get_pool_stats()
+        )
     
     while driver_pool.is_high_load:
         elapsed = time.monotonic() - wait_start
         remaining_total = max_wait_time - elapsed
 
-        if _log_limiter.should_log():
-            monitor_details.info(
-                f"[HIGH_LOAD] blocking {elapsed:.1f}s in {context}"
-            )
+        if log_info and _log_limiter.should_log():
+            monitor_details.info("[HIGH_LOAD] blocking %.1fs in %s", elapsed, context)
 
         if allow_timeout and remaining_total <= 0:
             break
 
-        unblocked = driver_pool.wait_for_unblock(timeout=wait_chunk_time)
-        if unblocked:
+        # the pool condition wakes us the moment load clears, chunks only exist
+        # for the progress log, so never sleep past the overall budget
+        chunk = min(wait_chunk_time, remaining_total) if allow_timeout else wait_chunk_time
+        if driver_pool.wait_for_unblock(timeout=chunk):
             break
 
-    elapsed = time.monotonic() - wait_start
-    pool_stats = driver_pool.get_pool_stats()
-    monitor_details.info(
-        f"[HIGH_LOAD] END {context}: blocked_for={elapsed:.1f}s, high_load={driver_pool.is_high_load}, pool_stats={pool_stats}"
-    )
+    if log_info:
+        monitor_details.info(
+            "[HIGH_LOAD] END %s: blocked_for=%.1fs, high_load=%s, pool_stats=%s",
+            context, time.monotonic() - wait_start, driver_pool.is_high_load, driver_pool.get_pool_stats()
+        )
 
     return True
 
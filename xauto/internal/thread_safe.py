@@ -2,9 +2,10 @@
 
 from xauto.utils.logging import debug_logger
 
-from typing import Any, List, Optional, Iterator
+from typing import Any, Iterable, List, Optional, Iterator
 from collections import deque
 import threading
+import queue
 
 class SafeThread(threading.Thread):
     def __init__(self, target_fn=None, name=None, **kwargs):
@@ -24,6 +25,8 @@ class SafeThread(threading.Thread):
 
 
 class AtomicCounter:
+    __slots__ = ('_value', '_lock')
+
     def __init__(self, initial_value: int = 0):
         self._value = initial_value
         self._lock = threading.Lock()
@@ -40,9 +43,9 @@ class AtomicCounter:
         with self._lock:
             self._value = 0
     
+    # += is a read-modify-write and needs the lock, reading the bound int does not
     def get(self) -> int:
-        with self._lock:
-            return self._value
+        return self._value
 
 
 class RingBuffer:
@@ -183,21 +186,23 @@ class ThreadSafeSet:
     
 
 class ThreadSafeDict:
+    __slots__ = ('_dict', '_lock')
+
     def __init__(self):
         self._dict = {}
         self._lock = threading.Lock()
     
+    # single key reads are one C call on the builtin dict, only writers and
+    # multi step snapshots need the lock, so lookups never queue behind a write
     def __getitem__(self, key: Any) -> Any:
-        with self._lock:
-            return self._dict[key]
+        return self._dict[key]
     
     def __setitem__(self, key: Any, value: Any) -> None:
         with self._lock:
             self._dict[key] = value
     
     def __len__(self) -> int:
-        with self._lock:
-            return len(self._dict)
+        return len(self._dict)
     
     def __iter__(self):
         with self._lock:
@@ -205,12 +210,10 @@ class ThreadSafeDict:
         return iter(keys)
     
     def __contains__(self, key: Any) -> bool:
-        with self._lock:
-            return key in self._dict
+        return key in self._dict
         
     def get(self, key: Any, default: Any = None) -> Any:
-        with self._lock:
-            return self._dict.get(key, default)
+        return self._dict.get(key, default)
     
     def clear(self) -> None:
         with self._lock:
@@ -228,3 +231,26 @@ class ThreadSafeDict:
         with self._lock:
             return list(self._dict.values())
         
+
+
+class TaskQueue(queue.Queue):
+    # put_many adds a batch under one lock acquisition and one notify per chunk,
+    # it goes through the _put/_qsize hooks and honours maxsize like put()
+    def put_many(self, items: Iterable[Any]) -> int:
+        items = list(items)
+        added = 0
+        with self.not_full:
+            while added < len(items):
+                if self.maxsize > 0:
+                    while self._qsize() >= self.maxsize:
+                        self.not_full.wait()
+                    room = self.maxsize - self._qsize()
+                else:
+                    room = len(items) - added
+                chunk = items[added:added + room]
+                for item in chunk:
+                    self._put(item)
+                self.unfinished_tasks += len(chunk)
+                self.not_empty.notify(len(chunk))
+                added += len(chunk)
+        return added
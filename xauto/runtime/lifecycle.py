@@ -61,7 +61,7 @@ def get_worker_limits() -> Tuple[Union[int, float], int]:
     debug_logger.info(f"Driver pool configured with driver_limit = {driver_limit}")
     return limit, limit
 
-def setup_runtime(task_processor: Callable) -> Tuple[TaskManager, Any]:
+def setup_runtime(task_processor: Callable, warm_drivers: int = 0) -> Tuple[TaskManager, Any]:
     options = get_options()
     driver_pool_max_size, max_workers = get_worker_limits()
     
@@ -71,6 +71,9 @@ def setup_runtime(task_processor: Callable) -> Tuple[TaskManager, Any]:
         max_size=driver_pool_max_size,
         firefox_options=options
     )
+    # spawn drivers side by side up front so the first tasks don't each wait on a browser boot
+    if warm_drivers > 0:
+        driver_pool.warm_up(warm_drivers)
     
     task_manager = TaskManager(
         driver_pool=driver_pool,
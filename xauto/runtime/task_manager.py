@@ -3,14 +3,14 @@
 from xauto.runtime.worker import Worker
 from xauto.internal.dataclasses import TaskWrapper
 from xauto.internal.geckodriver.driver import DriverPool
-from xauto.internal.thread_safe import AtomicCounter, ThreadSafeList, SafeThread
+from xauto.internal.thread_safe import AtomicCounter, ThreadSafeList, SafeThread, TaskQueue
 from xauto.utils.logging import debug_logger, monitor_details
 from xauto.utils.config import Config
 from xauto.utils.setup import debug
 
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterable
+from itertools import islice
 import threading
-import queue
 import time
 
 class TaskManager:
@@ -48,7 +48,7 @@ class TaskManager:
         self.scale_downs_this_cycle = AtomicCounter()
         self.last_scale_down_time = 0.0
 
-        self.task_queue = queue.Queue()
+        self.task_queue = TaskQueue()
         self._workers = ThreadSafeList()
         self._stop_event = threading.Event()
         self._tasks_added = 0
@@ -61,8 +61,20 @@ class TaskManager:
         self._tasks_added += 1
 
     def add_tasks(self, tasks: list) -> None:
-        for idx, _ in enumerate(tasks):
-            self.add_task(idx, tasks)
+        self.add_tasks_batch(tasks)
+
+    def add_tasks_batch(self, tasks: list, batch: int = 64, indices: Optional[Iterable[int]] = None) -> None:
+        if not tasks:
+            return
+
+        # one lock acquisition and one notify per chunk instead of per task
+        # indices selects a subset of tasks, a range is iterated lazily
+        indices = iter(range(len(tasks)) if indices is None else indices)
+        while True:
+            chunk = [TaskWrapper(idx=idx, tasks=tasks) for idx in islice(indices, batch)]
+            if not chunk:
+                break
+            self._tasks_added += self.task_queue.put_many(chunk)
     
     def wait_completion(self):
         self.task_queue.join()
@@ -144,10 +156,11 @@ class TaskManager:
     
     def _remove_dead_workers(self) -> None:
         now = time.monotonic()
+        workers = self._workers.snapshot()
         alive = []
         dead = 0
 
-        for w in self._workers:
+        for w in workers:
             if w.is_alive():
                 alive.append(w)
                 continue 
@@ -165,9 +178,11 @@ class TaskManager:
                     f"(age: {age:.1f}s)"
                 )
 
-        self._workers.clear()
-        for w in alive:
-            self._workers.append(w)
+        # runs every monitor tick, only rebuild the list when a worker actually exited
+        if len(alive) != len(workers):
+            self._workers.clear()
+            for w in alive:
+                self._workers.append(w)
 
         if dead > 0:
             try:
@@ -223,10 +238,11 @@ class TaskManager:
         for w in idle_workers[:remove]:
             w.stop()
             
+        stopping = set(idle_workers[:remove])
         keep = []
         removed = 0
         for w in self._workers:
-            if removed < remove and w in idle_workers:
+            if removed < remove and w in stopping:
                 removed += 1         
                 continue
             keep.append(w)
@@ -249,7 +265,7 @@ class TaskManager:
                 if w.is_alive():
                     debug_logger.warning(f"Worker {w.name} did not exit cleanly within {timeout}s")
                 else:
-                    debug_logger.debug(f"Worker {w.name} exited cleanly")
+                    debug_logger.debug("Worker %s exited cleanly", w.name)
             except Exception as e:
                 debug_logger.error(f"Error joining worker {w.name}: {e}", exc_info=debug)
         
@@ -17,7 +17,7 @@ class Worker(threading.Thread):
     __slots__ = (
         'task_queue', 'driver_pool', 'driver', 'name', 'task_count', 
         'successful_tasks', 'failed_tasks', '_exit_reason', 
-        '_max_task_retries', 'manager', 'current_task'
+        '_max_task_retries', 'manager', 'current_task', '_recreate_delay'
     )
     
     def __init__(
@@ -41,6 +41,7 @@ class Worker(threading.Thread):
         self.failed_tasks = 0
         self._exit_reason = "normal"
         self._max_task_retries = Config.get("misc.timeouts.max_worker_task_retries")
+        self._recreate_delay = Config.get("misc.timeouts.driver_recreate_delay")
     
     def stop(self) -> None:
         self.task_queue.put(None)
@@ -108,7 +109,7 @@ class Worker(threading.Thread):
                 debug_logger.error(f"Destroying {self.name} failed: {e}")
             self.driver = None
         
-        delay = Config.get("misc.timeouts.driver_recreate_delay")
+        delay = self._recreate_delay
         debug_logger.warning(f"{self.name} waiting {delay}s before recreating")
         time.sleep(delay)
 
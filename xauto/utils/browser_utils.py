@@ -26,7 +26,7 @@ def enable_injection_debug(driver: WebDriver) -> bool:
         debug_logger.debug("[DEBUG] JavaScript debug mode enabled")
         return True
     except Exception as e:
-        debug_logger.debug(f"[DEBUG] Failed to enable debug mode: {e}")
+        debug_logger.debug("[DEBUG] Failed to enable debug mode: %s", e)
         return False
 
 @require_connected(False)
@@ -75,6 +75,8 @@ def send_key(
     clear_field: bool = True
 ) -> bool:
     retries = Config.get("misc.timeouts.max_send_key_retries")
+    retry_base = Config.get("misc.timeouts.send_key_retry_base")
+    retry_jitter = Config.get("misc.timeouts.send_key_retry_jitter")
 
     for attempt in range(retries):
         try:
@@ -95,15 +97,12 @@ def send_key(
                 return True
 
         except StaleElementReferenceException:
-            debug_logger.debug(f"[send_key] StaleElement on attempt {attempt+1}, retrying")
+            debug_logger.debug("[send_key] StaleElement on attempt %d, retrying", attempt + 1)
     
             # add re-find elements on stale errors here
             # use your method of finding elements on the page
 
-            time.sleep(
-                Config.get("misc.timeouts.send_key_retry_base") +
-                random.uniform(0, Config.get("misc.timeouts.send_key_retry_jitter"))
-            )
+            time.sleep(retry_base + random.uniform(0, retry_jitter))
 
         except Exception as e:
             debug_logger.error(f"[send_key] Unexpected error: {e}")
@@ -8,6 +8,16 @@ from pathlib import Path
 from xauto.utils.logging import debug_logger
 
 CONFIG_KEY_ERRORS = (KeyError, TypeError)
+_MISSING = object()
+
+def _flatten(config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    flat = {}
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+    return flat
 
 class Config:
     _instance: Optional['Config'] = None
@@ -15,6 +25,7 @@ class Config:
     _config: Union[Dict[str, Any], types.MappingProxyType] = {}
     _config_path: Optional[Path] = None
     _frozen: bool = False
+    _flat: Dict[str, Any] = {}
     
     def __new__(cls, config_path: str = "settings.yaml") -> 'Config':
         if cls._instance is None:
@@ -39,9 +50,15 @@ class Config:
         return _global_config._get(key_path, default)
     
     def _get(self, key_path: str, default: Any = None) -> Any:
+        if self._frozen:
+            value = self._flat.get(key_path, _MISSING)
+            if value is _MISSING:
+                debug_logger.debug("Config key '%s' not found", key_path)
+                return default
+            return value
+
         keys = key_path.split('.')
-        config_dict = dict(self._config) if self._frozen else self._config
-        value: Any = config_dict
+        value: Any = self._config
         
         try:
             for i, key in enumerate(keys):
@@ -49,19 +66,18 @@ class Config:
                     value = value[key]
                 else:
                     partial_path = '.'.join(keys[:i+1])
-                    debug_logger.debug(f"Config path traversal failed at '{partial_path}': value is {type(value).__name__}, not dict")
+                    debug_logger.debug("Config path traversal failed at '%s': value is %s, not dict", partial_path, type(value).__name__)
                     return default
             return value
         except CONFIG_KEY_ERRORS as e:
-            debug_logger.debug(f"Config key '{key_path}' not found: {e}")
+            debug_logger.debug("Config key '%s' not found: %s", key_path, e)
             return default
     
     def get_nested(self, *keys: str, default: Any = None) -> Any:
         return self._get('.'.join(keys), default)
     
     def get_section(self, section: str) -> Dict[str, Any]:
-        config_dict = dict(self._config) if self._frozen else self._config
-        return config_dict.get(section, {})
+        return self._config.get(section, {})
     
     def set(self, key_path: str, value: Any) -> None:
         with self._lock:
@@ -81,9 +97,11 @@ class Config:
             current[keys[-1]] = value  # type: ignore
 
     def has_key(self, key_path: str) -> bool:
+        if self._frozen:
+            return key_path in self._flat
+
         keys = key_path.split('.')
-        config_dict = dict(self._config) if self._frozen else self._config
-        value: Any = config_dict
+        value: Any = self._config
         
         try:
             for key in keys:
@@ -98,6 +116,8 @@ class Config:
     def freeze(self) -> None:
         with self._lock:
             if not self._frozen:
+                # dotted keys resolve with a single dict lookup once frozen
+                self._flat = _flatten(self._config)
                 self._config = types.MappingProxyType(self._config)
                 self._frozen = True
                 debug_logger.info("Configuration frozen - no further modifications allowed")
@@ -44,10 +44,10 @@ def _inject_api(driver: WebDriver) -> bool:
 
         return bool(injected)
     except WebDriverException as e:
-        debug_logger.debug(f"[JS_INJECTION] Execution error during inject: {e}")
+        debug_logger.debug("[JS_INJECTION] Execution error during inject: %s", e)
         return False
     except Exception as e:
-        debug_logger.debug(f"[JS_INJECTION] Failed to inject: {e}")
+        debug_logger.debug("[JS_INJECTION] Failed to inject: %s", e)
         return False
 
 def wrap_driver_with_injection(driver: WebDriver) -> WebDriver:
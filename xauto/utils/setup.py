@@ -3,6 +3,7 @@
 from xauto.utils.config import Config
 
 import random
+import itertools
 import os
 import sys
 import tempfile
@@ -178,6 +179,10 @@ def get_options():
     options.set_preference("devtools.jsonview.enabled", False)
     return options
 
+# shuffled once per process then rotated, every agent gets an even share of spawns
+# and next() on a cycle is a single C call so concurrent callers don't need a lock
+_USER_AGENT_CYCLE = itertools.cycle(random.sample(list(USER_AGENTS.values()), len(USER_AGENTS)))
+
 def get_random_user_agent() -> str:
-    return random.choice(list(USER_AGENTS.values()))
+    return next(_USER_AGENT_CYCLE)
 
@@ -32,7 +32,7 @@ def check_driver_liveness(driver: WebDriver) -> bool:
         driver.execute_script("return 1")
         return True
     except WebDriverException as e:
-        debug_logger.debug(f"Driver liveness check failed – session dead: {e}")
+        debug_logger.debug("Driver liveness check failed – session dead: %s", e)
         return False
 
 def require_connected(default: Any) -> Any:
@@ -40,7 +40,7 @@ def require_connected(default: Any) -> Any:
         @functools.wraps(fn)
         def wrapper(driver, *args, **kwargs) -> bool:
             if not check_driver_liveness(driver):
-                debug_logger.debug(f"{fn.__name__}: driver not connected or dead, skipping")
+                debug_logger.debug("%s: driver not connected or dead, skipping", fn.__name__)
                 return default
             return fn(driver, *args, **kwargs)
         return wrapper
@@ -69,11 +69,14 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 _tls = threading.local()
 
 def get_session():
-    if not hasattr(_tls, "session"):
+    # plain attribute read on the hot path, the session only misses once per thread
+    try:
+        return _tls.session
+    except AttributeError:
         s = requests.Session()
         s.verify = False
         _tls.session = s
-    return _tls.session
+        return s
 
 REQUEST_BASE_HEADERS = {
     "Accept": "image/avif,image/webp,image/png,image/svg+xml,image/*;q=0.8,*/*;q=0.5",
@@ -132,20 +135,20 @@ def _is_cloudflare_challenge(driver: WebDriver) -> bool:
         page = (driver.page_source or "").lower()
 
         if CF_TITLE.search(title):
-            debug_bot_detection.debug(f"[BOT DETECTION] Cloudflare challenge via title: '{title[:100]}...'")
+            debug_bot_detection.debug("[BOT DETECTION] Cloudflare challenge via title: '%.100s...'", title)
             return True
         for indicator in CF_CHALLENGE_INDICATORS:
             if indicator in page:
-                debug_bot_detection.debug(f"[BOT DETECTION] Cloudflare challenge via indicator: '{indicator}'")
+                debug_bot_detection.debug("[BOT DETECTION] Cloudflare challenge via indicator: '%s'", indicator)
                 return True
         return False
     except Exception as e:
-        debug_bot_detection.debug(f"[BOT DETECTION] Cloudflare check error: {e}")
+        debug_bot_detection.debug("[BOT DETECTION] Cloudflare check error: %s", e)
         return False
 
 def is_bot_page(driver: WebDriver, url: str) -> bool:
     if _is_cloudflare_challenge(driver):
-        debug_bot_detection.debug(f"[BOT DETECTION] Cloudflare on {url}")
+        debug_bot_detection.debug("[BOT DETECTION] Cloudflare on %s", url)
         return True
 
     selectors = SELECTORS_MAP['bot']
@@ -160,7 +163,7 @@ def is_bot_page(driver: WebDriver, url: str) -> bool:
 
             for keyword, pattern in bot_patterns:
                 if pattern.search(outer):
-                    debug_bot_detection.debug(f"[BOT DETECTION] Matched '{keyword}' on {url}")
+                    debug_bot_detection.debug("[BOT DETECTION] Matched '%s' on %s", keyword, url)
                     return True
 
         except StaleElementReferenceException: